@@ -1,10 +1,15 @@
 import streamlit as st
-import time
 import os
 from datetime import datetime
-from kompas import KompasScraper
-from detik import DetikScraper
+from scrapers import create_scraper
+from search_session import SearchSession
+from checkpoint import CheckpointJournal, checkpoint_path
+from seen_index import get_default_index
+from article_store import get_default_store
 import pandas as pd
+import time
+import zipfile
+from io import BytesIO
 
 # Konfigurasi Streamlit
 st.set_page_config(
@@ -381,10 +386,90 @@ if 'selected_pages' not in st.session_state:
     st.session_state.selected_pages = None
 if 'search_results' not in st.session_state:
     st.session_state.search_results = None
+    st.session_state.search_session = None
 if 'max_articles' not in st.session_state:
     st.session_state.max_articles = None
 if 'news_source' not in st.session_state:
     st.session_state.news_source = "Kompas"
+if 'engine' not in st.session_state:
+    st.session_state.engine = "sync"
+
+
+def reset_search_session():
+    """Buang sesi pencarian; engine async menutup client dan event loop-nya"""
+    previous = st.session_state.get('search_session')
+    if previous is not None and hasattr(previous.scraper, 'close'):
+        previous.scraper.close()
+    st.session_state.search_session = None
+
+
+def get_search_session():
+    """Sesi pencarian (sumber, engine, keyword) yang dipakai ulang antar langkah"""
+    key = (st.session_state.news_source, st.session_state.engine, st.session_state.keyword)
+    if st.session_state.get('search_session') is None or st.session_state.get('search_session_key') != key:
+        reset_search_session()
+        scraper = create_scraper(st.session_state.news_source, st.session_state.engine)
+        st.session_state.search_session = SearchSession(scraper, st.session_state.keyword)
+        st.session_state.search_session_key = key
+    return st.session_state.search_session
+
+
+# Format export: label di UI -> (kunci, ekstensi, sudah terkompresi)
+EXPORT_FORMATS = {
+    "Excel (.xlsx)": ('excel', 'xlsx', True),
+    "JSON (.json)": ('json', 'json', False),
+    "Text (.txt)": ('txt', 'txt', False),
+    "JSON Lines (.jsonl.gz)": ('jsonl', 'jsonl.gz', True),
+    "Parquet (.parquet)": ('parquet', 'parquet', True),
+}
+
+
+def write_export(scraper, format_type, results, stream):
+    """Tulis hasil dalam satu format langsung ke stream biner"""
+    if format_type == 'excel':
+        scraper.save_to_excel(results, stream)
+    elif format_type == 'json':
+        scraper.save_to_json(results, stream)
+    elif format_type == 'txt':
+        scraper.save_to_txt(results, stream)
+    elif format_type == 'jsonl':
+        scraper.save_to_jsonl(results, stream, compression='gzip')
+    elif format_type == 'parquet':
+        scraper.save_to_parquet(results, stream)
+
+
+def build_exports(scraper, results, save_formats, base_filename):
+    """
+    Render export ke memori tanpa file sementara: satu format ke buffer,
+    beberapa format langsung ke entry ZIP
+
+    Returns:
+        Dict kunci format -> {'name', 'data'} (entry ZIP hanya berisi 'name'),
+        plus 'zip' jika lebih dari satu format
+    """
+    selected = [(key, f"{base_filename}.{extension}", compressed)
+                for label, (key, extension, compressed) in EXPORT_FORMATS.items() if label in save_formats]
+    files_data = {}
+
+    if len(selected) > 1:
+        zip_buffer = BytesIO()
+        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+            for format_type, name, compressed in selected:
+                entry = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+                # xlsx dan .gz sudah terkompresi: disimpan apa adanya
+                entry.compress_type = zipfile.ZIP_STORED if compressed else zipfile.ZIP_DEFLATED
+                with zip_file.open(entry, 'w') as stream:
+                    write_export(scraper, format_type, results, stream)
+                files_data[format_type] = {'name': name}
+        files_data['zip'] = {'name': f"{base_filename}.zip", 'data': zip_buffer.getvalue()}
+    else:
+        for format_type, name, _ in selected:
+            buffer = BytesIO()
+            write_export(scraper, format_type, results, buffer)
+            files_data[format_type] = {'name': name, 'data': buffer.getvalue()}
+
+    return files_data
+
 
 # Main Content - Halaman Pencarian
 if not st.session_state.keyword:
@@ -423,6 +508,16 @@ if not st.session_state.keyword:
             st.warning(f"{news_source} segera hadir")
             st.stop()
         
+        # Engine scraping: sync (threads) atau async (asyncio)
+        engine = st.radio(
+            "Engine Scraping",
+            options=["sync", "async"],
+            index=0 if st.session_state.engine == "sync" else 1,
+            horizontal=True,
+            help="sync: request paralel dengan thread, async: request paralel dengan asyncio (hasil identik)"
+        )
+        st.session_state.engine = engine
+        
         # Check if news source changed
         if news_source != st.session_state.news_source:
             st.session_state.news_source = news_source
@@ -430,6 +525,7 @@ if not st.session_state.keyword:
             st.session_state.total_pages = None
             st.session_state.selected_pages = None
             st.session_state.search_results = None
+            reset_search_session()
             st.rerun()
         
         st.markdown("<div style='margin: 1.5rem 0;'></div>", unsafe_allow_html=True)
@@ -456,6 +552,7 @@ if not st.session_state.keyword:
             st.session_state.total_pages = None
             st.session_state.selected_pages = None
             st.session_state.search_results = None
+            reset_search_session()
             st.rerun()
     
     # Panduan singkat
@@ -482,6 +579,45 @@ if not st.session_state.keyword:
             </div>
         </div>
         """, unsafe_allow_html=True)
+    
+    # Cari di arsip artikel yang sudah pernah di-scrape (SQLite FTS5)
+    st.markdown("<div style='margin: 2.5rem 0;'></div>", unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns([1, 2.5, 1])
+    with col2:
+        store = get_default_store()
+        total_archived = store.count()
+        st.markdown(f"""
+        <div class="card">
+            <h3 style="margin-bottom: 0.5rem; font-size: 1.3rem;">Cari di Arsip Artikel</h3>
+            <p style="color: #9ca3af; font-size: 0.85rem; margin: 0;">Pencarian full-text atas {total_archived} artikel yang sudah pernah di-scrape</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        search_col, source_col = st.columns([3, 1])
+        with search_col:
+            archive_query = st.text_input(
+                "Cari di arsip",
+                placeholder="Contoh: harga beras",
+                help="Semua kata harus ada di judul, ringkasan atau isi artikel",
+                label_visibility="collapsed"
+            )
+        with source_col:
+            archive_source = st.selectbox(
+                "Sumber arsip",
+                options=["Semua"] + store.sources(),
+                label_visibility="collapsed"
+            )
+        
+        if archive_query.strip():
+            start = time.perf_counter()
+            hits = store.search(archive_query, source=None if archive_source == "Semua" else archive_source)
+            elapsed = (time.perf_counter() - start) * 1000
+            st.caption(f"{len(hits)} artikel ditemukan ({elapsed:.1f} ms)")
+            for hit in hits:
+                st.markdown(f"**[{hit['title'] or hit['url']}]({hit['url']})**  \n"
+                            f"{hit['source']} · {hit['date_published'] or '-'}  \n"
+                            f"{hit['snippet']}")
 
 else:
     # STEP 1: Get total pages
@@ -493,18 +629,15 @@ else:
         </div>
         """, unsafe_allow_html=True)
         
-        # Initialize scraper based on selected news source
-        if st.session_state.news_source == "Detik":
-            scraper = DetikScraper()
-        else:
-            scraper = KompasScraper()
+        # Sesi pencarian menyimpan halaman 1 untuk dipakai lagi di langkah 2
+        search_session = get_search_session()
         
         with st.status("Mendeteksi halaman pencarian...", expanded=True) as status:
             st.write(f"Menganalisis hasil pencarian untuk: **{st.session_state.keyword}**")
             st.write(f"Sumber: **{st.session_state.news_source}**")
             
             try:
-                total_pages = scraper.get_total_search_pages(st.session_state.keyword)
+                total_pages = search_session.get_total_search_pages()
                 st.session_state.total_pages = total_pages
                 st.write(f"Ditemukan **{total_pages}** halaman hasil pencarian")
                 status.update(label=f"Deteksi selesai - {total_pages} halaman tersedia", state="complete", expanded=False)
@@ -553,19 +686,15 @@ else:
         
         # Cek apakah search sudah pernah dijalankan
         if st.session_state.search_results is None:
-            # Initialize scraper based on selected news source
-            if st.session_state.news_source == "Detik":
-                scraper = DetikScraper()
-            else:
-                scraper = KompasScraper()
+            # Halaman yang sudah diambil di langkah 1 (dan sebelumnya) tidak diunduh ulang
+            search_session = get_search_session()
             
             with st.status("Mengumpulkan artikel...", expanded=True) as status:
                 st.write(f"Mencari artikel dengan keyword: **{st.session_state.keyword}**")
                 st.write(f"Memproses {st.session_state.selected_pages} halaman...")
                 
                 try:
-                    articles, found_pages = scraper.search_articles(
-                        st.session_state.keyword, 
+                    articles, found_pages = search_session.search_articles(
                         max_pages=st.session_state.selected_pages
                     )
                     st.session_state.search_results = articles
@@ -737,9 +866,48 @@ else:
         
         st.divider()
         
+        resume = st.checkbox(
+            "Lanjutkan dari checkpoint",
+            value=st.session_state.get('resume', True),
+            help="Artikel yang sudah selesai pada proses sebelumnya (keyword dan sumber yang sama) tidak diambil ulang"
+        )
+        st.session_state.resume = resume
+        
+        seen_options = {
+            "Gunakan data tersimpan": "reuse",
+            "Lewati (hanya artikel baru)": "skip",
+            "Ambil ulang semua": "refetch",
+        }
+        seen_label = st.selectbox(
+            "Artikel yang sudah pernah di-scrape",
+            options=list(seen_options),
+            index=list(seen_options.values()).index(st.session_state.get('seen_mode', 'reuse')),
+            help="Artikel dari run sebelumnya (keyword apa pun) dicek sebelum detailnya diambil"
+        )
+        st.session_state.seen_mode = seen_options[seen_label]
+        
+        metadata_only = st.checkbox(
+            "Hanya metadata (tanpa isi artikel)",
+            value=st.session_state.get('metadata_only', False),
+            help="Judul, penulis, tanggal, kategori dan tag dibaca dari <head> halaman saja: jauh lebih cepat, kolom konten kosong"
+        )
+        st.session_state.metadata_only = metadata_only
+        
+        if st.session_state.engine == "sync":
+            parse_workers = st.number_input(
+                "Proses parsing",
+                min_value=0,
+                max_value=os.cpu_count() or 1,
+                value=st.session_state.get('parse_workers', 0),
+                help="0 = parsing di thread pengunduh; >0 = halaman di-parse di proses terpisah agar memakai semua core"
+            )
+            st.session_state.parse_workers = int(parse_workers)
+        
+        st.divider()
+        
         st.write("**Format Output**")
         
-        col1, col2, col3 = st.columns(3)
+        col1, col2, col3, col4, col5 = st.columns(5)
         
         with col1:
             save_excel = st.checkbox("Excel (.xlsx)", value=True)
@@ -747,6 +915,11 @@ else:
             save_json = st.checkbox("JSON (.json)", value=True)
         with col3:
             save_txt = st.checkbox("Text (.txt)", value=True)
+        with col4:
+            save_jsonl = st.checkbox("JSON Lines (.jsonl.gz)", value=False)
+        with col5:
+            save_parquet = st.checkbox("Parquet (.parquet)", value=False,
+                                       help="Kolumnar untuk analitik: skema tetap, tanggal sebagai timestamp")
         
         save_formats = []
         if save_excel:
@@ -755,6 +928,10 @@ else:
             save_formats.append("JSON (.json)")
         if save_txt:
             save_formats.append("Text (.txt)")
+        if save_jsonl:
+            save_formats.append("JSON Lines (.jsonl.gz)")
+        if save_parquet:
+            save_formats.append("Parquet (.parquet)")
         
         if not save_formats:
             st.markdown('<div class="alert-warning">Pilih minimal satu format penyimpanan</div>', unsafe_allow_html=True)
@@ -787,11 +964,14 @@ else:
         
         # Cek apakah scraping sudah pernah dijalankan
         if 'scraping_results' not in st.session_state:
-            # Initialize scraper based on selected news source
-            if st.session_state.news_source == "Detik":
-                scraper = DetikScraper()
+            # Initialize scraper based on selected news source and engine
+            if st.session_state.engine == "sync" and st.session_state.get('parse_workers'):
+                scraper = create_scraper(st.session_state.news_source, parse_workers=st.session_state.parse_workers)
+            elif st.session_state.engine == "async":
+                # Event loop dan client httpx yang sama dengan langkah pencarian
+                scraper = get_search_session().scraper
             else:
-                scraper = KompasScraper()
+                scraper = create_scraper(st.session_state.news_source, st.session_state.engine)
             
             articles_to_process = st.session_state.search_results
             if st.session_state.max_articles:
@@ -801,85 +981,75 @@ else:
                 try:
                     results = []
                     progress_bar = st.progress(0)
+                    total = len(articles_to_process)
+                    
+                    seen_mode = st.session_state.get('seen_mode', 'reuse')
+                    
+                    # Checkpoint: artikel yang selesai dicatat agar bisa dilanjutkan jika proses terhenti
+                    # ("Ambil ulang semua" tidak memakai hasil checkpoint)
+                    journal = CheckpointJournal(checkpoint_path(st.session_state.news_source, st.session_state.keyword))
+                    if st.session_state.get('resume', True) and seen_mode != 'refetch':
+                        done = journal.load()
+                    else:
+                        done = {}
+                        journal.reset()
+                    
+                    # Indeks lintas run: URL yang sudah pernah di-scrape dipakai ulang atau dilewati
+                    seen_index = get_default_index()
+                    # Arsip full-text: artikel baru ditulis per batch transaksi
+                    store = get_default_store()
+                    if seen_mode != 'refetch':
+                        seen = seen_index.get_many([article['url'] for article in articles_to_process])
+                        if seen:
+                            status.write(f"{len(seen)} artikel sudah pernah di-scrape sebelumnya")
+                        if seen_mode == 'reuse':
+                            for url, record in seen.items():
+                                done.setdefault(url, record)
+                        else:
+                            articles_to_process = [article for article in articles_to_process if article['url'] not in seen]
+                            total = len(articles_to_process)
+                    
+                    resumed = sum(1 for article in articles_to_process if article['url'] in done)
+                    if resumed:
+                        status.write(f"Melanjutkan: {resumed} artikel sudah selesai")
+                    
+                    # Detail diambil paralel dan diproses satu per satu begitu selesai,
+                    # urutan tetap sesuai hasil pencarian
+                    metadata_only = st.session_state.get('metadata_only', False)
+                    details = scraper.iter_article_details(
+                        [article['url'] for article in articles_to_process if article['url'] not in done],
+                        metadata_only=metadata_only
+                    )
                     
                     for idx, article in enumerate(articles_to_process, 1):
-                        status.write(f"[{idx}/{len(articles_to_process)}] {article['title'][:60]}...")
-                        
-                        detail = scraper.get_article_detail(article['url'])
-                        
-                        if detail:
-                            article.update(detail)
-                            results.append(article)
+                        if article['url'] in done:
+                            results.append(done[article['url']])
                         else:
-                            article['content'] = "Gagal mengambil konten"
-                            article['author'] = ""
-                            article['date_published'] = article['date']
-                            article['categories'] = article['category']
-                            article['tags'] = ""
-                            article['total_pages'] = 1
-                            article['multi_page'] = False
-                            results.append(article)
+                            status.write(f"[{idx}/{total}] {article['title'][:60]}...")
+                            detail = next(details)
+                            if detail:
+                                article.update(detail)
+                                # Record tanpa konten tidak dicatat agar run lengkap berikutnya tetap mengambilnya
+                                if not metadata_only:
+                                    journal.record(article)
+                                    seen_index.add(article, source=st.session_state.news_source)
+                                    store.add(article, source=st.session_state.news_source)
+                                results.append(article)
+                            else:
+                                results.append(scraper.mark_failed(article))
                         
-                        progress_bar.progress(idx / len(articles_to_process))
-                        
-                        if idx < len(articles_to_process):
-                            time.sleep(1)
+                        progress_bar.progress(idx / total)
                     
-                    # Simpan ke temporary files untuk download
-                    import tempfile
-                    import zipfile
-                    from io import BytesIO
+                    store.flush()
+                    # Run selesai: checkpoint hanya untuk melanjutkan run yang terhenti
+                    journal.reset()
                     
                     # Base filename berdasarkan sumber berita
                     default_name = f"{st.session_state.news_source.lower()}_{st.session_state.keyword}"
                     base_filename = st.session_state.custom_filename or default_name
                     
-                    files_data = {}
-                    
-                    if "Excel (.xlsx)" in st.session_state.save_formats:
-                        temp_excel = tempfile.NamedTemporaryFile(delete=False, suffix=".xlsx")
-                        temp_excel.close()  # Close file before using it
-                        scraper.save_to_excel(results, temp_excel.name)
-                        with open(temp_excel.name, 'rb') as f:
-                            files_data['excel'] = {'name': f"{base_filename}.xlsx", 'data': f.read()}
-                        try:
-                            os.unlink(temp_excel.name)
-                        except:
-                            pass  # Ignore if file is still locked
-                    
-                    if "JSON (.json)" in st.session_state.save_formats:
-                        temp_json = tempfile.NamedTemporaryFile(delete=False, suffix=".json", mode='w', encoding='utf-8')
-                        temp_json.close()  # Close file before using it
-                        scraper.save_to_json(results, temp_json.name)
-                        with open(temp_json.name, 'r', encoding='utf-8') as f:
-                            files_data['json'] = {'name': f"{base_filename}.json", 'data': f.read().encode('utf-8')}
-                        try:
-                            os.unlink(temp_json.name)
-                        except:
-                            pass  # Ignore if file is still locked
-                    
-                    if "Text (.txt)" in st.session_state.save_formats:
-                        temp_txt = tempfile.NamedTemporaryFile(delete=False, suffix=".txt", mode='w', encoding='utf-8')
-                        temp_txt.close()  # Close file before using it
-                        scraper.save_to_txt(results, temp_txt.name)
-                        with open(temp_txt.name, 'r', encoding='utf-8') as f:
-                            files_data['txt'] = {'name': f"{base_filename}.txt", 'data': f.read().encode('utf-8')}
-                        try:
-                            os.unlink(temp_txt.name)
-                        except:
-                            pass  # Ignore if file is still locked
-                    
-                    # Buat ZIP file jika lebih dari 1 format
-                    if len(files_data) > 1:
-                        zip_buffer = BytesIO()
-                        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-                            for format_type, file_info in files_data.items():
-                                zip_file.writestr(file_info['name'], file_info['data'])
-                        zip_buffer.seek(0)
-                        files_data['zip'] = {
-                            'name': f"{base_filename}.zip",
-                            'data': zip_buffer.getvalue()
-                        }
+                    # Render file download langsung di memori (tanpa file sementara)
+                    files_data = build_exports(scraper, results, st.session_state.save_formats, base_filename)
                     
                     status.update(label="Scraping selesai", state="complete", expanded=False)
                     
@@ -982,6 +1152,24 @@ else:
                                 type="primary",
                                 use_container_width=True
                             )
+                        elif format_type == 'jsonl':
+                            st.download_button(
+                                label="Download JSON Lines",
+                                data=file_info['data'],
+                                file_name=file_info['name'],
+                                mime="application/gzip",
+                                type="primary",
+                                use_container_width=True
+                            )
+                        elif format_type == 'parquet':
+                            st.download_button(
+                                label="Download Parquet",
+                                data=file_info['data'],
+                                file_name=file_info['name'],
+                                mime="application/vnd.apache.parquet",
+                                type="primary",
+                                use_container_width=True
+                            )
                         
                         file_size = len(file_info['data']) / 1024
                         st.markdown(f"""
@@ -1023,6 +1211,7 @@ else:
                     st.session_state.total_pages = None
                     st.session_state.selected_pages = None
                     st.session_state.search_results = None
+                    reset_search_session()
                     st.session_state.max_articles = None
                     st.session_state.scraping_results = None
                     st.rerun()
@@ -0,0 +1,125 @@
+"""
+Article Module
+Record artikel ringkas yang dipakai bersama oleh scraper dan writer: satu
+skema field tetap (__slots__, tanpa dict per artikel) dengan API seperti dict
+(get, [], update, in, items) sehingga kode lama tetap berjalan. String field
+berkardinalitas rendah (kategori, penulis, tags, tanggal, sumber) di-intern
+agar nilai yang sama dipakai bersama oleh semua artikel.
+"""
+
+import sys
+from collections.abc import Mapping, MutableMapping
+
+# Skema bersama (urutan = urutan kolom saat diubah ke dict/JSON)
+FIELDS = (
+    'title', 'url', 'image_url', 'category', 'date', 'summary', 'description',
+    'author', 'editor', 'date_published', 'categories', 'content', 'tags',
+    'total_pages', 'multi_page', 'source',
+)
+
+# Nilai yang berulang antar artikel
+INTERNED_FIELDS = frozenset({
+    'category', 'date', 'author', 'editor', 'date_published', 'categories', 'tags', 'source',
+})
+
+_FIELD_SET = frozenset(FIELDS)
+_MISSING = object()
+
+
+class Article(MutableMapping):
+    """
+    Record artikel dengan field tetap; field yang belum diisi dianggap tidak
+    ada (seperti key dict yang belum diset). Key di luar skema (mis. data
+    internal '_page_urls') disimpan di dict `extra` yang hanya dibuat jika perlu.
+    """
+
+    __slots__ = FIELDS + ('extra',)
+
+    def __init__(self, data=None, **fields):
+        self.extra = None
+        if data is not None:
+            self.update(data)
+        if fields:
+            self.update(fields)
+
+    def __getitem__(self, key):
+        if key in _FIELD_SET:
+            value = getattr(self, key, _MISSING)
+            if value is not _MISSING:
+                return value
+        elif self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key in _FIELD_SET:
+            if key in INTERNED_FIELDS and type(value) is str:
+                value = sys.intern(value)
+            setattr(self, key, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __delitem__(self, key):
+        if key in _FIELD_SET and hasattr(self, key):
+            delattr(self, key)
+        elif self.extra and key in self.extra:
+            del self.extra[key]
+        else:
+            raise KeyError(key)
+
+    def __iter__(self):
+        for name in FIELDS:
+            if hasattr(self, name):
+                yield name
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __contains__(self, key):
+        if key in _FIELD_SET:
+            return hasattr(self, key)
+        return bool(self.extra) and key in self.extra
+
+    def get(self, key, default=None):
+        if key in _FIELD_SET:
+            return getattr(self, key, default)
+        return self.extra.get(key, default) if self.extra else default
+
+    def update(self, other=(), **fields):
+        items = other.items() if isinstance(other, Mapping) else other
+        for key, value in items:
+            self[key] = value
+        for key, value in fields.items():
+            self[key] = value
+
+    def to_dict(self):
+        """Dict biasa (urutan field skema, lalu key tambahan)"""
+        return {key: self[key] for key in self}
+
+    def copy(self):
+        return Article(self)
+
+    def __reduce__(self):
+        # Dikirim antar proses (parse pool) sebagai dict
+        return (Article, (self.to_dict(),))
+
+    def __repr__(self):
+        return f"Article({self.to_dict()!r})"
+
+
+def as_article(record):
+    """Article dari dict (mis. record JSON tersimpan); Article dan None dikembalikan apa adanya"""
+    if record is None or isinstance(record, Article):
+        return record
+    return Article(record)
+
+
+def json_default(value):
+    """Argumen `default` json.dump/json.dumps agar Article ditulis sebagai object JSON"""
+    if isinstance(value, Article):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -0,0 +1,226 @@
+"""
+Article Store Module
+Arsip artikel hasil scraping di SQLite (satu baris per URL) dengan indeks
+full-text FTS5 atas judul, deskripsi/ringkasan dan konten, sehingga seluruh
+korpus bisa dicari tanpa scraping ulang atau membuka file export.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from article import Article, json_default
+from http_cache import normalize_url
+
+DEFAULT_STORE_PATH = os.path.join('.cache', 'articles.sqlite')
+
+# Artikel ditampung lalu ditulis dalam satu transaksi per batch
+DEFAULT_BATCH_SIZE = 200
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    key TEXT PRIMARY KEY,
+    url TEXT,
+    source TEXT,
+    title TEXT,
+    description TEXT,
+    content TEXT,
+    author TEXT,
+    categories TEXT,
+    tags TEXT,
+    date_published TEXT,
+    record TEXT,
+    scraped_at REAL
+);
+CREATE INDEX IF NOT EXISTS articles_source ON articles(source);
+
+-- Indeks FTS5 external content: teks hanya disimpan sekali (di tabel articles)
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, description, content,
+    content='articles', content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts(rowid, title, description, content)
+    VALUES (new.rowid, new.title, new.description, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts(articles_fts, rowid, title, description, content)
+    VALUES ('delete', old.rowid, old.title, old.description, old.content);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_au AFTER UPDATE ON articles BEGIN
+    INSERT INTO articles_fts(articles_fts, rowid, title, description, content)
+    VALUES ('delete', old.rowid, old.title, old.description, old.content);
+    INSERT INTO articles_fts(rowid, title, description, content)
+    VALUES (new.rowid, new.title, new.description, new.content);
+END;
+"""
+
+# Upsert (bukan INSERT OR REPLACE): REPLACE menghapus baris tanpa memicu
+# trigger delete, sehingga indeks FTS akan berisi entri basi
+UPSERT = """
+INSERT INTO articles (key, url, source, title, description, content, author, categories,
+                      tags, date_published, record, scraped_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(key) DO UPDATE SET
+    url = excluded.url, source = excluded.source, title = excluded.title,
+    description = excluded.description, content = excluded.content,
+    author = excluded.author, categories = excluded.categories, tags = excluded.tags,
+    date_published = excluded.date_published, record = excluded.record,
+    scraped_at = excluded.scraped_at
+"""
+
+# Bobot bm25 per kolom FTS (title, description, content)
+RANK_WEIGHTS = (10.0, 4.0, 1.0)
+
+
+def fts_query(text):
+    """
+    Kata kunci bebas -> query FTS5 aman: setiap kata dikutip (semua kata harus
+    ada), sehingga tanda seperti '-', ':' atau '"' tidak dibaca sebagai operator
+    """
+    terms = text.split()
+    return ' '.join('"{}"'.format(term.replace('"', '""')) for term in terms)
+
+
+class ArticleStore:
+    def __init__(self, path=DEFAULT_STORE_PATH, batch_size=DEFAULT_BATCH_SIZE):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.batch_size = max(1, batch_size)
+        self.lock = threading.Lock()
+        self.pending = []
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    def row(self, article, source):
+        def text(*keys):
+            for key in keys:
+                value = article.get(key)
+                if value:
+                    return str(value)
+            return ''
+
+        return (
+            normalize_url(article['url']), article['url'], article.get('source') or source,
+            text('title'), text('description', 'summary'), text('content'), text('author'),
+            text('categories', 'category'), text('tags'), text('date_published', 'date'),
+            json.dumps(article, ensure_ascii=False, default=json_default), time.time(),
+        )
+
+    def add(self, article, source=''):
+        """Tampung artikel; ditulis ke database saat batch penuh (atau flush())"""
+        with self.lock:
+            self.pending.append(self.row(article, source))
+            if len(self.pending) >= self.batch_size:
+                self.write_pending()
+
+    def add_many(self, articles, source=''):
+        """Simpan banyak artikel (list atau generator) per batch transaksi"""
+        count = 0
+        for article in articles:
+            self.add(article, source)
+            count += 1
+        self.flush()
+        return count
+
+    def write_pending(self):
+        # Dipanggil dengan lock dipegang
+        if not self.pending:
+            return
+        with self.conn:
+            self.conn.executemany(UPSERT, self.pending)
+        self.pending = []
+
+    def flush(self):
+        """Tulis semua artikel yang masih ditampung"""
+        with self.lock:
+            self.write_pending()
+
+    def search(self, query, source=None, limit=50, raw=False):
+        """
+        Cari artikel di seluruh arsip (peringkat bm25, judul berbobot tertinggi)
+
+        Args:
+            query: Kata kunci (semua kata harus ada)
+            source: Batasi ke satu sumber, mis. 'Kompas'
+            limit: Jumlah hasil maksimal
+            raw: True untuk memakai sintaks query FTS5 apa adanya (OR, NEAR, prefix*)
+
+        Returns:
+            List dict: url, source, title, date_published, snippet, rank
+        """
+        match = query if raw else fts_query(query)
+        if not match:
+            return []
+        sql = f"""
+            SELECT a.url, a.source, a.title, a.date_published,
+                   snippet(articles_fts, -1, '**', '**', '…', 16),
+                   bm25(articles_fts, {', '.join(map(str, RANK_WEIGHTS))}) AS rank
+            FROM articles_fts JOIN articles a ON a.rowid = articles_fts.rowid
+            WHERE articles_fts MATCH ?
+        """
+        params = [match]
+        if source:
+            sql += " AND a.source = ?"
+            params.append(source)
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+
+        self.flush()
+        with self.lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        columns = ('url', 'source', 'title', 'date_published', 'snippet', 'rank')
+        return [dict(zip(columns, row)) for row in rows]
+
+    def get(self, url):
+        """Record artikel lengkap untuk URL, atau None"""
+        self.flush()
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT record FROM articles WHERE key = ?", (normalize_url(url),)
+            ).fetchone()
+        return Article(json.loads(row[0])) if row else None
+
+    def count(self, source=None):
+        """Jumlah artikel di arsip (opsional per sumber)"""
+        self.flush()
+        with self.lock:
+            if source:
+                return self.conn.execute(
+                    "SELECT COUNT(*) FROM articles WHERE source = ?", (source,)
+                ).fetchone()[0]
+            return self.conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def sources(self):
+        """Daftar sumber yang ada di arsip"""
+        self.flush()
+        with self.lock:
+            rows = self.conn.execute("SELECT DISTINCT source FROM articles ORDER BY source").fetchall()
+        return [row[0] for row in rows if row[0]]
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+
+def get_default_store():
+    """Arsip bersama untuk semua scraper dalam satu proses"""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = ArticleStore()
+        return _default_store
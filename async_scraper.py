@@ -0,0 +1,363 @@
+"""
+Async Scraper Module
+Engine asyncio (httpx.AsyncClient) untuk Kompas.com dan Detik.com.
+Operasi sama dengan KompasScraper/DetikScraper dan parsing memakai method
+scraper sync, sehingga hasil ekstraksi identik.
+"""
+
+import asyncio
+import threading
+from collections import deque
+
+import httpx
+
+from kompas import KompasScraper
+from detik import DetikScraper
+from ratelimit import shared_limiter
+
+
+class AsyncScraper:
+    """Dasar engine async: client httpx, semaphore dan rate limiter per host"""
+
+    parser_class = None
+
+    def __init__(self, max_concurrency=100, rate_limiter=None, parser=None, max_workers=None,
+                 **parser_options):
+        """
+        Args:
+            max_concurrency: Maksimal request berjalan bersamaan
+            rate_limiter: RateLimiter (default: shared_limiter)
+            parser: Scraper sync untuk parsing (default: dibuat dari parser_options)
+            max_workers: Opsi engine sync; di sini dipakai sebagai max_concurrency
+            **parser_options: Opsi scraper sync lain (cache, parser_backend, pool_size,
+                              parse_workers) untuk scraper parser; parse_workers tidak
+                              dipakai engine async (parsing berjalan di event loop)
+        """
+        # Scraper sync dipakai hanya untuk parsing (tanpa request)
+        self.parser = parser or self.parser_class(rate_limiter=rate_limiter, **parser_options)
+        if max_workers:
+            max_concurrency = max_workers
+        self.max_concurrency = max(1, max_concurrency)
+        self.rate_limiter = rate_limiter or shared_limiter
+        self.client = None
+        self.semaphore = None
+
+    async def __aenter__(self):
+        # Accept-Encoding & Connection diatur sendiri oleh httpx
+        headers = {
+            key: value for key, value in self.parser.session.headers.items()
+            if key.lower() not in ('accept-encoding', 'connection')
+        }
+        self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.client = httpx.AsyncClient(
+            headers=headers,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=self.max_concurrency)
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.client.aclose()
+        self.client = None
+
+    async def fetch(self, url, **kwargs):
+        """GET lewat cache HTTP milik parser, dengan batas semaphore dan rate limiter per host"""
+        async def send(url, **kwargs):
+            async with self.semaphore:
+                return await self.rate_limiter.request_async(self.client.get, url, **kwargs)
+
+        if self.parser.cache:
+            return await self.parser.cache.fetch_async(send, url, **kwargs)
+        return await send(url, **kwargs)
+
+    async def get_article_details(self, urls, metadata_only=False):
+        """Ambil detail banyak artikel sekaligus, hasil sesuai urutan urls"""
+        return list(await asyncio.gather(*(self.get_article_detail(url, metadata_only) for url in urls)))
+
+    def run(self, method, *args, **kwargs):
+        """Jalankan satu operasi async dari kode sync, mis. run('search_articles', 'banjir')"""
+        async def runner():
+            async with self:
+                return await getattr(self, method)(*args, **kwargs)
+        return asyncio.run(runner())
+
+
+class AsyncKompasScraper(AsyncScraper):
+    parser_class = KompasScraper
+
+    async def fetch_search_page(self, keyword, page):
+        """Ambil dan parse satu halaman hasil pencarian"""
+        params = {
+            'q': keyword,
+            'page': page
+        }
+        response = await self.fetch(self.parser.base_search_url, params=params, timeout=30)
+        response.raise_for_status()
+        return self.parser.search_soup(response)
+
+    async def get_total_search_pages(self, keyword):
+        """Mendapatkan total halaman pencarian tanpa mengambil artikel"""
+        try:
+            soup = await self.fetch_search_page(keyword, 1)
+            total_pages = self.parser.get_total_pages(soup)
+            return total_pages if total_pages else 1
+        except Exception as e:
+            print(f"Error mendapatkan total halaman: {e}")
+            return 1
+
+    async def search_articles(self, keyword, max_pages=None, parallel=True):
+        """Ambil halaman 1, lalu halaman 2..N secara bersamaan (parallel selalu aktif)"""
+        print(f"[SEARCHING] Memulai pencarian async untuk keyword: {keyword}")
+
+        try:
+            first_soup = await self.fetch_search_page(keyword, 1)
+        except Exception as e:
+            print(f"Error saat mengambil halaman 1: {e}")
+            return [], None
+
+        total_pages = self.parser.get_total_pages(first_soup)
+        last_page = min(total_pages, max_pages) if max_pages else total_pages
+
+        pages = [self.parser.parse_search_page(first_soup)]
+        pages.extend(await self.fetch_search_pages(keyword, range(2, last_page + 1)))
+
+        return self.parser.merge_search_pages(pages), total_pages
+
+    async def fetch_search_pages(self, keyword, pages):
+        """Ambil dan parse beberapa halaman pencarian bersamaan (None jika kosong/gagal)"""
+        async def fetch(page):
+            try:
+                return self.parser.parse_search_page(await self.fetch_search_page(keyword, page))
+            except Exception as e:
+                print(f"Error saat mengambil halaman {page}: {e}")
+                return None
+
+        return list(await asyncio.gather(*(fetch(page) for page in pages)))
+
+    async def get_article_detail(self, url, metadata_only=False):
+        """Ambil detail lengkap artikel (atau hanya metadata <head> jika metadata_only)"""
+        max_retries = 3
+        retry_count = 0
+
+        while retry_count < max_retries:
+            try:
+                print(f"   Mengambil detail: {url}")
+                response = await self.fetch(self.parser.article_url(url), timeout=30)
+                response.raise_for_status()
+
+                return self.parser.parse_response(response, url, metadata_only)
+
+            except (httpx.TimeoutException, httpx.NetworkError) as e:
+                retry_count += 1
+                if retry_count < max_retries:
+                    wait_time = 2 ** retry_count
+                    print(f"   Koneksi gagal - Retry {retry_count}/{max_retries} dalam {wait_time}s...")
+                    await asyncio.sleep(wait_time)
+                else:
+                    print(f"   Error koneksi setelah {max_retries} percobaan: {e}")
+                    return None
+
+            except httpx.HTTPError as e:
+                print(f"   Error request: {e}")
+                return None
+
+            except Exception as e:
+                print(f"   Error lain saat mengambil detail: {e}")
+                return None
+
+
+class AsyncDetikScraper(AsyncScraper):
+    parser_class = DetikScraper
+
+    async def fetch_search_page(self, keyword, page=None):
+        """Ambil dan parse satu halaman hasil pencarian"""
+        params = {
+            'query': keyword,
+            'result_type': 'relevansi'
+        }
+        if page is not None:
+            params['page'] = page
+
+        response = await self.fetch(self.parser.search_url, params=params, timeout=10)
+        response.raise_for_status()
+        return self.parser.search_soup(response)
+
+    async def get_total_search_pages(self, keyword):
+        """Mendapatkan total halaman hasil pencarian"""
+        print(f"[SEARCHING] Mengecek total halaman untuk keyword: {keyword}")
+
+        try:
+            soup = await self.fetch_search_page(keyword)
+            return self.parser.get_total_pages(soup)
+        except Exception as e:
+            print(f"Error saat mengecek total halaman: {str(e)}")
+            return 1
+
+    async def search_articles(self, keyword, max_pages=5, parallel=True):
+        """Ambil halaman 1, lalu halaman 2..N secara bersamaan (parallel selalu aktif)"""
+        print(f"[SEARCHING] Memulai pencarian async untuk keyword: {keyword}")
+
+        try:
+            first_soup = await self.fetch_search_page(keyword, 1)
+        except Exception as e:
+            print(f"Error saat mengambil halaman 1: {str(e)}")
+            return [], max_pages
+
+        total_pages = self.parser.get_total_pages(first_soup)
+        last_page = min(total_pages, max_pages) if max_pages else total_pages
+
+        pages = [self.parser.parse_search_page(first_soup)]
+        pages.extend(await self.fetch_search_pages(keyword, range(2, last_page + 1)))
+
+        all_articles = self.parser.merge_search_pages(pages)
+        print(f"Total artikel ditemukan: {len(all_articles)}")
+        return all_articles, last_page
+
+    async def fetch_search_pages(self, keyword, pages):
+        """Ambil dan parse beberapa halaman pencarian bersamaan (artikel, jumlah item)"""
+        async def fetch(page):
+            try:
+                return self.parser.parse_search_page(await self.fetch_search_page(keyword, page))
+            except Exception as e:
+                print(f"Error saat mengambil halaman {page}: {str(e)}")
+                return [], 0
+
+        return list(await asyncio.gather(*(fetch(page) for page in pages)))
+
+    async def get_article_detail(self, url, metadata_only=False):
+        """Mengambil detail lengkap artikel (atau hanya metadata <head> jika metadata_only)"""
+        print(f"   Mengambil detail: {url}")
+
+        try:
+            response = await self.fetch(url, timeout=15)
+            response.raise_for_status()
+
+            article = self.parser.parse_response(response, url, metadata_only)
+
+        except Exception as e:
+            print(f"   Error mengambil detail artikel: {str(e)}")
+            return None
+        return await self.complete_article(article)
+
+    async def get_page_content(self, url):
+        """Ambil isi satu halaman lanjutan artikel multi-halaman ('' jika gagal)"""
+        print(f"   Mengambil detail: {url}")
+        try:
+            response = await self.fetch(url, timeout=15)
+            response.raise_for_status()
+            return self.parser.extract_content(self.parser.response_soup(response))
+        except Exception as e:
+            print(f"   Error mengambil halaman artikel: {str(e)}")
+            return ''
+
+    async def complete_article(self, article):
+        """Ambil halaman 2..N artikel multi-halaman bersamaan lalu gabungkan kontennya"""
+        page_urls = article.pop('_page_urls', None)
+        if not page_urls:
+            return article
+        contents = await asyncio.gather(*(self.get_page_content(page_url) for page_url in page_urls))
+        return self.parser.merge_pages(article, contents)
+
+
+class SyncBridge:
+    """
+    Bungkus engine async agar bisa dipanggil seperti scraper sync.
+
+    Satu event loop di thread latar dan satu client httpx dipakai untuk semua
+    panggilan selama bridge hidup (koneksi tidak diputus antar langkah). Method
+    async engine dijalankan di loop tersebut; atribut parser tanpa request
+    (save_to_*, mark_failed, parse_*, dll.) diteruskan ke scraper sync milik
+    engine, sedangkan operasi jaringan yang tidak ada di engine async ditolak.
+    """
+
+    # Method scraper sync yang melakukan request sendiri (threads + requests)
+    SYNC_ONLY = frozenset({'download_article', 'search_articles_parallel', 'pool_stats', 'session'})
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.loop = None
+        self.thread = None
+        self.lock = threading.Lock()
+
+    def start(self):
+        """Jalankan event loop latar dan buka client engine (sekali saja)"""
+        with self.lock:
+            if self.loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name='async-scraper', daemon=True)
+                thread.start()
+                asyncio.run_coroutine_threadsafe(self.engine.__aenter__(), loop).result()
+                self.loop, self.thread = loop, thread
+        return self.loop
+
+    def submit(self, coro):
+        """Jadwalkan coroutine di loop bridge, hasilnya concurrent.futures.Future"""
+        return asyncio.run_coroutine_threadsafe(coro, self.start())
+
+    def call(self, method, *args, **kwargs):
+        """Jalankan satu method async engine dan tunggu hasilnya"""
+        return self.submit(getattr(self.engine, method)(*args, **kwargs)).result()
+
+    def close(self):
+        """Tutup client engine dan hentikan event loop"""
+        with self.lock:
+            loop, self.loop = self.loop, None
+            if loop is None:
+                return
+            asyncio.run_coroutine_threadsafe(self.engine.__aexit__(None, None, None), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            self.thread.join()
+            loop.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def iter_article_details(self, urls, max_workers=None, window=None, metadata_only=False):
+        """
+        Yield detail artikel sesuai urutan urls. Jendela geser: maksimal `window`
+        artikel berjalan/menunggu sekaligus (default: 2x max_workers atau konkurensi
+        engine); artikel berikutnya dimulai begitu artikel terdepan di-yield.
+        """
+        window = max(1, window or (max_workers or self.engine.max_concurrency) * 2)
+        in_flight = deque()
+        try:
+            for url in urls:
+                in_flight.append(self.submit(self.engine.get_article_detail(url, metadata_only)))
+                if len(in_flight) >= window:
+                    yield in_flight.popleft().result()
+            while in_flight:
+                yield in_flight.popleft().result()
+        finally:
+            # Iterasi dihentikan pemanggil: batalkan artikel yang belum selesai
+            for future in in_flight:
+                future.cancel()
+
+    def get_article_details(self, urls, max_workers=None, metadata_only=False):
+        return list(self.iter_article_details(urls, max_workers=max_workers, metadata_only=metadata_only))
+
+    def scrape_by_keyword(self, keyword, **kwargs):
+        """Seperti scraper sync (lihat iter_scrape_by_keyword), dengan request lewat engine async"""
+        return list(self.iter_scrape_by_keyword(keyword, **kwargs))
+
+    def iter_scrape_by_keyword(self, keyword, **kwargs):
+        """
+        Alur iter_scrape_by_keyword scraper sync, dengan pencarian dan detail
+        artikel diambil lewat engine async (search_articles, iter_article_details)
+        """
+        scrape = getattr(self.engine.parser_class, 'iter_scrape_by_keyword', None)
+        if scrape is None:
+            raise AttributeError(f"{self.engine.parser_class.__name__} tidak punya iter_scrape_by_keyword")
+        return scrape(self, keyword, **kwargs)
+
+    def __getattr__(self, name):
+        attr = getattr(self.engine, name, None)
+        if attr is None:
+            if name in self.SYNC_ONLY:
+                raise AttributeError(f"Operasi '{name}' tidak didukung engine async")
+            return getattr(self.engine.parser, name)
+        if asyncio.iscoroutinefunction(attr):
+            return lambda *args, **kwargs: self.call(name, *args, **kwargs)
+        return attr
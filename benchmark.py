@@ -0,0 +1,320 @@
+"""
+Benchmark Module
+Benchmark parser offline atas fixture HTML tersimpan (folder fixtures/):
+pages/sec dan waktu per extractor untuk setiap backend parser, tanpa request
+jaringan. Sebelum diukur, hasil parsing setiap fixture dicek terhadap nilai
+yang diharapkan (fixtures/expected.json: judul, penulis, jumlah halaman,
+jumlah item pencarian, dst.) agar parser yang cepat tapi salah tidak lolos.
+Hasil bisa disimpan sebagai baseline lalu dibandingkan setelah perubahan kode.
+
+Pemakaian:
+    python benchmark.py [--repeat 20] [--backend lxml] [--fixtures DIR]
+                        [--save baseline.json] [--compare baseline.json] [--tolerance 0.25]
+                        [--check-only] [--skip-check] [--write-expected]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import re
+import statistics
+import sys
+import time
+
+from detik import DetikScraper
+from html_parser import (available_backends, compare_head_metadata, compare_search_strainer,
+                         field_extractors, make_soup)
+from kompas import KompasScraper
+from parse_pool import build_response
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+EXPECTED_FILE = 'expected.json'
+
+# Field artikel yang dicek terhadap expected.json
+ARTICLE_CHECK_FIELDS = ('title', 'author', 'date_published', 'categories', 'tags', 'total_pages')
+CONTENT_PREFIX = 60
+
+SCRAPER_CLASSES = {'kompas': KompasScraper, 'detik': DetikScraper}
+
+CANONICAL_PATTERN = re.compile(rb'<link[^>]+rel="canonical"[^>]+href="([^"]+)"', re.IGNORECASE)
+
+
+def load_fixtures(directory=FIXTURE_DIR):
+    """
+    Baca fixture HTML dengan nama <sumber>_<jenis>[_nama].html
+
+    Returns:
+        List dict: name, source ('kompas'/'detik'), kind ('article'/'search'), markup (bytes), url
+    """
+    fixtures = []
+    for filename in sorted(os.listdir(directory)):
+        if not filename.endswith('.html'):
+            continue
+        parts = filename[:-len('.html')].split('_')
+        if len(parts) < 2 or parts[0] not in SCRAPER_CLASSES or parts[1] not in ('article', 'search'):
+            continue
+        with open(os.path.join(directory, filename), 'rb') as f:
+            markup = f.read()
+        match = CANONICAL_PATTERN.search(markup)
+        fixtures.append({
+            'name': filename,
+            'source': parts[0],
+            'kind': parts[1],
+            'markup': markup,
+            'url': match.group(1).decode('utf-8') if match else '',
+        })
+    return fixtures
+
+
+def search_items(result):
+    """Daftar artikel dari parse_search_page (Kompas: list/None, Detik: (list, jumlah))"""
+    if isinstance(result, tuple):
+        result = result[0]
+    return result or []
+
+
+def fixture_summary(scraper, fixture):
+    """Nilai yang dicek dari hasil parsing satu fixture"""
+    markup, url = fixture['markup'], fixture['url']
+    response = build_response(url, markup, 'utf-8')
+    if fixture['kind'] == 'article':
+        article = scraper.parse_response(response, url) or {}
+        content = article.get('content') or ''
+        summary = {field: article.get(field) for field in ARTICLE_CHECK_FIELDS}
+        summary['content_start'] = content[:CONTENT_PREFIX]
+        summary['content_length'] = len(content)
+        return summary
+
+    soup = scraper.search_soup(response)
+    items = search_items(scraper.parse_search_page(soup))
+    return {
+        'total_pages': scraper.get_total_pages(scraper.search_soup(response)),
+        'item_count': len(items),
+        'first_title': items[0].get('title') if items else None,
+        'first_url': items[0].get('url') if items else None,
+    }
+
+
+def load_expected(directory=FIXTURE_DIR):
+    path = os.path.join(directory, EXPECTED_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def check_fixtures(fixtures, backends, expected):
+    """
+    Cek kebenaran hasil parsing setiap fixture di setiap backend: nilai yang
+    diharapkan, serta kesamaan jalur cepat dengan DOM lengkap (metadata <head>
+    vs extractor DOM, strainer pencarian vs halaman penuh)
+
+    Returns:
+        List (backend, fixture, field, diharapkan, hasil) yang tidak cocok
+    """
+    failures = []
+    for backend in backends:
+        scrapers = {source: cls(cache=None, parser_backend=backend) for source, cls in SCRAPER_CLASSES.items()}
+        for fixture in fixtures:
+            scraper, name = scrapers[fixture['source']], fixture['name']
+            with contextlib.redirect_stdout(io.StringIO()):
+                summary = fixture_summary(scraper, fixture)
+                if fixture['kind'] == 'article':
+                    parity = compare_head_metadata(scraper, fixture['markup'], fixture['url'], backend)
+                    pairs = {field: (values['dom'], values['response']) for field, values in parity.items()}
+                else:
+                    parity = compare_search_strainer(scraper, fixture['markup'], fixture['url'], backend)
+                    pairs = {field: (values['full'], values['strainer']) for field, values in parity.items()}
+
+            if name not in expected:
+                failures.append((backend, name, '(expected.json)', 'ada entri', 'tidak ada'))
+            for field, value in expected.get(name, {}).items():
+                if summary.get(field) != value:
+                    failures.append((backend, name, field, value, summary.get(field)))
+            for field, (reference, value) in pairs.items():
+                failures.append((backend, name, f'jalur cepat: {field}', reference, value))
+    return failures
+
+
+def write_expected(fixtures, directory=FIXTURE_DIR, backend=None):
+    """Tulis expected.json dari hasil parsing saat ini (periksa isinya sebelum di-commit)"""
+    scrapers = {source: cls(cache=None, parser_backend=backend) for source, cls in SCRAPER_CLASSES.items()}
+    with contextlib.redirect_stdout(io.StringIO()):
+        expected = {fixture['name']: fixture_summary(scrapers[fixture['source']], fixture) for fixture in fixtures}
+    path = os.path.join(directory, EXPECTED_FILE)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(expected, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+    return path
+
+
+def measure(func, repeat, setup=None):
+    """
+    Median waktu (detik) satu panggilan func
+
+    Args:
+        func: Fungsi yang diukur; menerima hasil setup() jika setup diberikan
+        repeat: Jumlah pengulangan
+        setup: Fungsi penyiapan input per pengulangan (tidak ikut diukur)
+    """
+    timings = []
+    for _ in range(repeat):
+        argument = setup() if setup else None
+        start = time.perf_counter()
+        if setup:
+            func(argument)
+        else:
+            func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def bench_article(scraper, fixture, repeat):
+    """Waktu pipeline lengkap (per halaman), parse DOM, metadata <head> dan tiap extractor"""
+    markup, url, backend = fixture['markup'], fixture['url'], scraper.parser_backend
+    response = build_response(url, markup, 'utf-8')
+
+    def new_soup():
+        return make_soup(markup, backend)
+
+    timings = {
+        'page': measure(lambda: scraper.parse_response(response, url), repeat),
+        'make_soup': measure(new_soup, repeat),
+        'head_metadata': measure(lambda: scraper.response_metadata(response), repeat),
+    }
+    # Soup baru untuk setiap panggilan: sebagian extractor mengubah soup (decompose)
+    for name, extractor in field_extractors(scraper):
+        timings[name] = measure(lambda soup, extractor=extractor: extractor(soup, url), repeat, setup=new_soup)
+    return timings
+
+
+def bench_search(scraper, fixture, repeat):
+    """Waktu halaman pencarian: parse parsial + daftar artikel, dan get_total_pages"""
+    markup = fixture['markup']
+    response = build_response(fixture['url'], markup, 'utf-8')
+
+    def search_page():
+        return scraper.parse_search_page(scraper.search_soup(response))
+
+    return {
+        'page': measure(search_page, repeat),
+        'search_soup': measure(lambda: scraper.search_soup(response), repeat),
+        'parse_search_page': measure(scraper.parse_search_page, repeat,
+                                     setup=lambda: scraper.search_soup(response)),
+        'get_total_pages': measure(scraper.get_total_pages, repeat,
+                                   setup=lambda: scraper.search_soup(response)),
+    }
+
+
+def run_benchmarks(fixtures, backends, repeat):
+    """
+    Returns:
+        Dict backend -> nama_fixture -> metrik -> detik per panggilan
+    """
+    results = {}
+    for backend in backends:
+        scrapers = {source: cls(cache=None, parser_backend=backend) for source, cls in SCRAPER_CLASSES.items()}
+        results[backend] = {}
+        for fixture in fixtures:
+            scraper = scrapers[fixture['source']]
+            bench = bench_article if fixture['kind'] == 'article' else bench_search
+            # Scraper mencetak log saat parsing; tidak relevan untuk benchmark
+            with contextlib.redirect_stdout(io.StringIO()):
+                results[backend][fixture['name']] = bench(scraper, fixture, repeat)
+    return results
+
+
+def print_report(results):
+    for backend, fixtures in results.items():
+        print(f"\n=== Backend: {backend} ===")
+        total_time = 0.0
+        for name, timings in fixtures.items():
+            total_time += timings['page']
+            print(f"\n{name}: {1 / timings['page']:.1f} pages/sec")
+            for metric, seconds in timings.items():
+                if metric != 'page':
+                    print(f"   {metric:<24} {seconds * 1000:8.3f} ms")
+        if fixtures:
+            print(f"\nKorpus ({len(fixtures)} halaman): {len(fixtures) / total_time:.1f} pages/sec")
+
+
+def compare_results(results, baseline, tolerance):
+    """
+    Bandingkan dengan baseline
+
+    Returns:
+        List (backend, fixture, metrik, detik_baseline, detik_sekarang) yang melambat
+        lebih dari `tolerance` (mis. 0.25 = 25%)
+    """
+    regressions = []
+    for backend, fixtures in results.items():
+        for name, timings in fixtures.items():
+            reference = baseline.get(backend, {}).get(name, {})
+            for metric, seconds in timings.items():
+                before = reference.get(metric)
+                if before and seconds > before * (1 + tolerance):
+                    regressions.append((backend, name, metric, before, seconds))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark parser offline atas fixture HTML")
+    parser.add_argument('--repeat', type=int, default=20, help="Pengulangan per pengukuran (default: 20)")
+    parser.add_argument('--backend', action='append', help="Backend parser (default: semua yang terpasang)")
+    parser.add_argument('--fixtures', default=FIXTURE_DIR, help="Folder fixture HTML")
+    parser.add_argument('--save', help="Simpan hasil sebagai baseline JSON")
+    parser.add_argument('--compare', help="Bandingkan dengan baseline JSON")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="Batas perlambatan (default: 0.25 = 25%%)")
+    parser.add_argument('--check-only', action='store_true', help="Hanya cek kebenaran parsing, tanpa benchmark")
+    parser.add_argument('--skip-check', action='store_true', help="Lewati cek kebenaran parsing")
+    parser.add_argument('--write-expected', action='store_true',
+                        help="Tulis ulang expected.json dari hasil parsing saat ini")
+    args = parser.parse_args(argv)
+
+    fixtures = load_fixtures(args.fixtures)
+    if not fixtures:
+        print(f"Tidak ada fixture di {args.fixtures}")
+        return 2
+    backends = args.backend or available_backends()
+
+    if args.write_expected:
+        path = write_expected(fixtures, args.fixtures, backends[0])
+        print(f"Nilai yang diharapkan disimpan: {path}")
+        return 0
+
+    if not args.skip_check:
+        failures = check_fixtures(fixtures, backends, load_expected(args.fixtures))
+        if failures:
+            print(f"[SALAH] {len(failures)} hasil parsing tidak sesuai:")
+            for backend, name, field, wanted, actual in failures:
+                print(f"   {backend} {name} {field}: diharapkan {wanted!r}, hasil {actual!r}")
+            return 1
+        print(f"Cek kebenaran: {len(fixtures)} fixture sesuai di {', '.join(backends)}")
+        if args.check_only:
+            return 0
+
+    results = run_benchmarks(fixtures, backends, max(1, args.repeat))
+    print_report(results)
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nBaseline disimpan: {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_results(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n[REGRESI] {len(regressions)} metrik lebih lambat dari baseline:")
+            for backend, name, metric, before, after in regressions:
+                print(f"   {backend} {name} {metric}: {before * 1000:.3f} ms -> {after * 1000:.3f} ms")
+            return 1
+        print(f"\nTidak ada regresi dibanding {args.compare}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""
+Charset Module
+Jalur masuk tunggal untuk body respons: parser menerima byte mentah beserta
+encoding dari charset yang dideklarasikan (header Content-Type atau <meta
+charset> di awal dokumen) atau encoding yang pernah terdeteksi untuk host yang
+sama, sehingga deteksi encoding atas seluruh body dan decode ganda tidak
+terjadi di jalur utama.
+"""
+
+import codecs
+import re
+import threading
+from urllib.parse import urlsplit
+
+from html_parser import make_soup
+
+HEADER_CHARSET = re.compile(r'charset\s*=\s*["\']?\s*([-\w.:]+)', re.IGNORECASE)
+META_CHARSET = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([-\w.:]+)', re.IGNORECASE)
+
+# Deklarasi <meta charset> harus ada di awal dokumen (spesifikasi HTML: 1024 byte)
+SNIFF_BYTES = 4096
+
+# Seperti browser: latin-1/ascii yang dideklarasikan dibaca sebagai windows-1252
+ENCODING_ALIASES = {'iso8859-1': 'windows-1252', 'ascii': 'windows-1252', 'latin-1': 'windows-1252'}
+
+# Argumen `encoding` default: belum dicari (None berarti "dideteksi parser")
+UNRESOLVED = object()
+
+
+def normalize_encoding(name):
+    """Nama codec Python untuk nama charset, atau None jika tidak dikenal"""
+    if not name:
+        return None
+    try:
+        encoding = codecs.lookup(name.strip()).name
+    except LookupError:
+        return None
+    return ENCODING_ALIASES.get(encoding, encoding)
+
+
+def declared_charset(headers):
+    """Charset dari header Content-Type (None jika tidak ada)"""
+    match = HEADER_CHARSET.search(headers.get('content-type') or '')
+    return normalize_encoding(match.group(1)) if match else None
+
+
+def meta_charset(body):
+    """Charset dari <meta charset> / http-equiv di awal dokumen (None jika tidak ada)"""
+    match = META_CHARSET.search(body[:SNIFF_BYTES])
+    return normalize_encoding(match.group(1).decode('ascii', 'ignore')) if match else None
+
+
+def host_of(url):
+    return (urlsplit(str(url)).hostname or '').lower()
+
+
+class HostEncodings:
+    """Encoding yang diketahui per host, dipakai jika respons tidak mendeklarasikan charset"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.hosts = {}
+        # Statistik sumber encoding
+        self.declared = 0
+        self.remembered = 0
+        self.detected = 0
+
+    def encoding_for(self, response):
+        """
+        Encoding body respons tanpa deteksi: header, <meta charset>, lalu host
+
+        Returns:
+            Nama codec, atau None jika harus dideteksi parser
+        """
+        encoding = declared_charset(response.headers) or meta_charset(response.content)
+        host = host_of(response.url)
+        with self.lock:
+            if encoding:
+                self.declared += 1
+                self.hosts[host] = encoding
+                return encoding
+            encoding = self.hosts.get(host)
+            if encoding:
+                self.remembered += 1
+            return encoding
+
+    def learn(self, url, encoding):
+        """Catat encoding hasil deteksi parser untuk host ini"""
+        encoding = normalize_encoding(encoding)
+        if not encoding:
+            return
+        with self.lock:
+            self.detected += 1
+            self.hosts[host_of(url)] = encoding
+
+    def stats(self):
+        with self.lock:
+            return {
+                'hosts': dict(self.hosts),
+                'declared': self.declared,
+                'remembered': self.remembered,
+                'detected': self.detected,
+            }
+
+
+# Dipakai bersama semua scraper dalam satu proses
+shared_encodings = HostEncodings()
+
+
+def soup_from_response(response, backend=None, parse_only=None, encodings=None, encoding=UNRESOLVED):
+    """
+    Parse body respons (requests/httpx) dari byte mentah
+
+    Encoding yang belum diketahui dideteksi sekali oleh parser, lalu diingat
+    untuk host tersebut. `encoding` hasil encodings.encoding_for() yang sudah
+    dicari pemanggil dipakai apa adanya agar tidak dicari (dan dihitung) dua kali.
+    """
+    encodings = encodings or shared_encodings
+    if encoding is UNRESOLVED:
+        encoding = encodings.encoding_for(response)
+    soup = make_soup(response.content, backend, parse_only=parse_only, from_encoding=encoding)
+    if encoding is None and soup.original_encoding:
+        encodings.learn(response.url, soup.original_encoding)
+    return soup
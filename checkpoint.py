@@ -0,0 +1,74 @@
+"""
+Checkpoint Module
+Jurnal append-only (JSON Lines) berisi artikel yang sudah selesai di-scrape,
+supaya proses yang terhenti bisa dilanjutkan tanpa mengulang dari awal.
+"""
+
+import json
+import os
+import re
+import threading
+
+from article import Article, json_default
+
+DEFAULT_CHECKPOINT_DIR = '.checkpoints'
+
+
+def checkpoint_path(source, keyword, directory=DEFAULT_CHECKPOINT_DIR):
+    """Path file checkpoint untuk kombinasi sumber berita + keyword"""
+    name = re.sub(r'[^\w-]+', '_', f"{source}_{keyword}".lower()).strip('_')
+    return os.path.join(directory, f"{name}.jsonl")
+
+
+class CheckpointJournal:
+    def __init__(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.lock = threading.Lock()
+
+    def load(self):
+        """
+        Baca semua record yang sudah selesai
+
+        Returns:
+            Dict url -> record artikel (record terakhir menang)
+        """
+        done = {}
+        if not os.path.exists(self.path):
+            return done
+
+        with open(self.path, 'rb') as f:
+            data = f.read()
+
+        # Baris terakhir bisa terpotong jika proses mati saat menulis:
+        # potong agar record berikutnya tidak tersambung ke baris rusak
+        complete = data.rfind(b'\n') + 1
+        if complete < len(data):
+            with self.lock:
+                with open(self.path, 'r+b') as f:
+                    f.truncate(complete)
+
+        for line in data[:complete].splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict) and record.get('url'):
+                done[record['url']] = Article(record)
+        return done
+
+    def record(self, article):
+        """Tambahkan satu artikel yang sudah selesai ke jurnal"""
+        line = json.dumps(article, ensure_ascii=False, default=json_default) + '\n'
+        with self.lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def reset(self):
+        """Kosongkan jurnal untuk memulai run baru"""
+        with self.lock:
+            open(self.path, 'w', encoding='utf-8').close()
@@ -1,61 +1,176 @@
-import requests
-from bs4 import BeautifulSoup
-import time
-import json
-import pandas as pd
-from datetime import datetime
+from datetime import timedelta, timezone
 import re
+from urllib.parse import urljoin
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from ratelimit import shared_limiter
+from http_client import create_session
+from http_cache import get_default_cache
+import exporters
+from article_store import get_default_store
+from article import Article
+from html_parser import class_pattern, default_backend
+from charset import UNRESOLVED, shared_encodings, soup_from_response
+from metadata import extract_head_metadata, parse_datetime
+from parse_pool import ParsePipeline
+from bs4 import SoupStrainer
+
+# Halaman pencarian: hanya bangun subtree daftar artikel dan pagination
+SEARCH_PAGE_STRAINER = SoupStrainer(class_=class_pattern('list-content__item', 'pagination'))
+
+# Format tanggal halaman detail Detik, mis. "Selasa, 02 Jan 2024 10:00 WIB"
+DAY_NAMES = ['Senin', 'Selasa', 'Rabu', 'Kamis', 'Jumat', 'Sabtu', 'Minggu']
+MONTH_NAMES = ['Jan', 'Feb', 'Mar', 'Apr', 'Mei', 'Jun', 'Jul', 'Agu', 'Sep', 'Okt', 'Nov', 'Des']
+WIB = timezone(timedelta(hours=7))
 
 class DetikScraper:
-    def __init__(self):
+    def __init__(self, max_workers=5, rate_limiter=None, pool_size=None, cache=True, parser_backend=None,
+                 parse_workers=None):
         self.base_url = "https://www.detik.com"
         self.search_url = f"{self.base_url}/search/searchall"
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
+        # Jumlah worker untuk pengambilan halaman paralel
+        self.max_workers = max(1, max_workers)
+        # Session dengan pool koneksi keep-alive, dipakai ulang antar request
+        self.session = create_session(pool_size=pool_size or max(10, self.max_workers), headers=self.headers)
+        # Batas laju per host, dipakai bersama semua scraper
+        self.rate_limiter = rate_limiter or shared_limiter
+        # Cache respons HTTP di disk (True = cache bersama, None/False = nonaktif)
+        self.cache = get_default_cache() if cache is True else (cache or None)
+        # Backend parser HTML: 'lxml' (default jika terpasang) atau 'html.parser'
+        self.parser_backend = parser_backend or default_backend()
+        # Encoding per host: body di-parse dari byte mentah tanpa deteksi ulang
+        self.encodings = shared_encodings
+        # Jumlah proses untuk tahap parsing (None/0 = parsing di thread fetch)
+        self.parse_workers = parse_workers
+    
+    def fetch(self, url, **kwargs):
+        """Kirim GET lewat cache HTTP, lalu session dan rate limiter per host"""
+        def send(url, **kwargs):
+            return self.rate_limiter.request(self.session.get, url, **kwargs)
         
-    def get_total_search_pages(self, keyword):
-        """Mendapatkan total halaman hasil pencarian"""
-        print(f"[SEARCHING] Mengecek total halaman untuk keyword: {keyword}")
-        
+        if self.cache:
+            return self.cache.fetch(send, url, **kwargs)
+        return send(url, **kwargs)
+    
+    def pool_stats(self):
+        """Statistik connection pool: koneksi dibuka, dipakai ulang, request per koneksi"""
+        return self.session.pool_stats.snapshot()
+    
+    def fetch_search_page(self, keyword, page=None):
+        """Ambil dan parse satu halaman hasil pencarian"""
         params = {
             'query': keyword,
             'result_type': 'relevansi'
         }
+        if page is not None:
+            params['page'] = page
         
-        try:
-            response = requests.get(self.search_url, params=params, headers=self.headers, timeout=10)
-            response.raise_for_status()
+        response = self.fetch(self.search_url, params=params, timeout=10)
+        response.raise_for_status()
+        return self.search_soup(response)
+    
+    def get_total_pages(self, soup):
+        """Mendapatkan total halaman dari pagination"""
+        pagination = soup.find('div', class_='pagination')
+        if pagination:
+            # Ambil semua link pagination
+            page_links = pagination.find_all('a', class_='pagination__item')
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # Cari halaman terakhir (yang bukan "Next" atau "Prev")
+            max_page = 1
+            for link in page_links:
+                text = link.get_text(strip=True)
+                if text.isdigit():
+                    page_num = int(text)
+                    if page_num > max_page:
+                        max_page = page_num
             
-            # Cari pagination
-            pagination = soup.find('div', class_='pagination')
-            if pagination:
-                # Ambil semua link pagination
-                page_links = pagination.find_all('a', class_='pagination__item')
-                
-                # Cari halaman terakhir (yang bukan "Next" atau "Prev")
-                max_page = 1
-                for link in page_links:
-                    text = link.get_text(strip=True)
-                    if text.isdigit():
-                        page_num = int(text)
-                        if page_num > max_page:
-                            max_page = page_num
-                
-                print(f"Total halaman ditemukan: {max_page}")
-                return max_page
-            else:
-                print("Pagination tidak ditemukan, return 1 halaman")
-                return 1
+            print(f"Total halaman ditemukan: {max_page}")
+            return max_page
+        else:
+            print("Pagination tidak ditemukan, return 1 halaman")
+            return 1
+        
+    def get_total_search_pages(self, keyword):
+        """Mendapatkan total halaman hasil pencarian"""
+        print(f"[SEARCHING] Mengecek total halaman untuk keyword: {keyword}")
+        
+        try:
+            soup = self.fetch_search_page(keyword)
+            return self.get_total_pages(soup)
                 
         except Exception as e:
             print(f"Error saat mengecek total halaman: {str(e)}")
             return 1
     
-    def search_articles(self, keyword, max_pages=5):
-        """Mencari artikel berdasarkan keyword"""
+    def parse_search_page(self, soup):
+        """Ekstrak semua artikel dari satu halaman pencarian"""
+        page_articles = []
+        
+        # Cari semua artikel
+        articles = soup.find_all('article', class_='list-content__item')
+        
+        for article in articles:
+            try:
+                # Extract title dan URL
+                title_elem = article.find('h3', class_='media__title')
+                if not title_elem:
+                    continue
+                
+                link_elem = title_elem.find('a', class_='media__link')
+                if not link_elem:
+                    continue
+                
+                title = link_elem.get_text(strip=True)
+                url = link_elem.get('href', '')
+                
+                # Extract category
+                category_elem = article.find('h2', class_='media__subtitle')
+                category = category_elem.get_text(strip=True) if category_elem else ''
+                
+                # Extract date
+                date_elem = article.find('div', class_='media__date')
+                date_text = ''
+                if date_elem:
+                    date_span = date_elem.find('span')
+                    if date_span:
+                        date_text = date_span.get_text(strip=True)
+                
+                # Extract description
+                desc_elem = article.find('div', class_='media__desc')
+                description = desc_elem.get_text(strip=True) if desc_elem else ''
+                
+                article_data = Article(
+                    title=title,
+                    url=url,
+                    category=category,
+                    date=date_text,
+                    description=description
+                )
+                
+                page_articles.append(article_data)
+                
+            except Exception as e:
+                print(f"Error parsing artikel: {str(e)}")
+                continue
+        
+        return page_articles, len(articles)
+    
+    def search_articles(self, keyword, max_pages=5, parallel=False):
+        """
+        Mencari artikel berdasarkan keyword
+        
+        Args:
+            keyword: Kata kunci pencarian
+            max_pages: Maksimal halaman pencarian
+            parallel: Ambil halaman 2..N secara paralel setelah total halaman diketahui
+        """
+        if parallel:
+            return self.search_articles_parallel(keyword, max_pages=max_pages)
+        
         print(f"[SEARCHING] Memulai pencarian untuk keyword: {keyword}")
         
         all_articles = []
@@ -63,70 +178,13 @@ class DetikScraper:
         for page in range(1, max_pages + 1):
             print(f"Mengambil halaman {page}...")
             
-            params = {
-                'query': keyword,
-                'result_type': 'relevansi',
-                'page': page
-            }
-            
             try:
-                response = requests.get(self.search_url, params=params, headers=self.headers, timeout=10)
-                response.raise_for_status()
+                soup = self.fetch_search_page(keyword, page)
                 
-                soup = BeautifulSoup(response.content, 'html.parser')
+                page_articles, found = self.parse_search_page(soup)
+                all_articles.extend(page_articles)
                 
-                # Cari semua artikel
-                articles = soup.find_all('article', class_='list-content__item')
-                
-                for article in articles:
-                    try:
-                        # Extract title dan URL
-                        title_elem = article.find('h3', class_='media__title')
-                        if not title_elem:
-                            continue
-                        
-                        link_elem = title_elem.find('a', class_='media__link')
-                        if not link_elem:
-                            continue
-                        
-                        title = link_elem.get_text(strip=True)
-                        url = link_elem.get('href', '')
-                        
-                        # Extract category
-                        category_elem = article.find('h2', class_='media__subtitle')
-                        category = category_elem.get_text(strip=True) if category_elem else ''
-                        
-                        # Extract date
-                        date_elem = article.find('div', class_='media__date')
-                        date_text = ''
-                        if date_elem:
-                            date_span = date_elem.find('span')
-                            if date_span:
-                                date_text = date_span.get_text(strip=True)
-                        
-                        # Extract description
-                        desc_elem = article.find('div', class_='media__desc')
-                        description = desc_elem.get_text(strip=True) if desc_elem else ''
-                        
-                        article_data = {
-                            'title': title,
-                            'url': url,
-                            'category': category,
-                            'date': date_text,
-                            'description': description
-                        }
-                        
-                        all_articles.append(article_data)
-                        
-                    except Exception as e:
-                        print(f"Error parsing artikel: {str(e)}")
-                        continue
-                
-                print(f"Ditemukan {len(articles)} artikel di halaman {page}")
-                
-                # Delay untuk menghindari rate limit
-                if page < max_pages:
-                    time.sleep(1)
+                print(f"Ditemukan {found} artikel di halaman {page}")
                     
             except Exception as e:
                 print(f"Error saat mengambil halaman {page}: {str(e)}")
@@ -135,102 +193,399 @@ class DetikScraper:
         print(f"Total artikel ditemukan: {len(all_articles)}")
         return all_articles, max_pages
     
-    def get_article_detail(self, url):
-        """Mengambil detail lengkap artikel"""
+    def search_articles_parallel(self, keyword, max_pages=5):
+        """Ambil halaman 1, lalu halaman 2..N secara paralel dalam batas rate limiter host"""
+        print(f"[SEARCHING] Memulai pencarian paralel untuk keyword: {keyword}")
+        
+        try:
+            print("Mengambil halaman 1...")
+            first_soup = self.fetch_search_page(keyword, 1)
+        except Exception as e:
+            print(f"Error saat mengambil halaman 1: {str(e)}")
+            return [], max_pages
+        
+        total_pages = self.get_total_pages(first_soup)
+        last_page = min(total_pages, max_pages) if max_pages else total_pages
+        
+        pages = [self.parse_search_page(first_soup)]
+        pages.extend(self.fetch_search_pages(keyword, range(2, last_page + 1)))
+        
+        all_articles = self.merge_search_pages(pages)
+        print(f"Total artikel ditemukan: {len(all_articles)}")
+        return all_articles, last_page
+    
+    def fetch_search_pages(self, keyword, pages):
+        """
+        Ambil dan parse beberapa halaman pencarian secara paralel
+        
+        Returns:
+            Hasil parse_search_page (artikel, jumlah item) per halaman sesuai urutan pages
+        """
+        pages = list(pages)
+        if not pages:
+            return []
+        
+        def fetch(page):
+            try:
+                return self.parse_search_page(self.fetch_search_page(keyword, page))
+            except Exception as e:
+                print(f"Error saat mengambil halaman {page}: {str(e)}")
+                return [], 0
+        
+        print(f"Mengambil {len(pages)} halaman pencarian secara paralel...")
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pages))) as executor:
+            return list(executor.map(fetch, pages))
+    
+    def merge_search_pages(self, pages):
+        """Gabungkan hasil (artikel, jumlah item) per halaman sesuai urutan halaman"""
+        all_articles = []
+        for page, (page_articles, found) in enumerate(pages, 1):
+            print(f"Ditemukan {found} artikel di halaman {page}")
+            all_articles.extend(page_articles)
+        return all_articles
+    
+    def get_article_detail(self, url, metadata_only=False):
+        """Mengambil detail lengkap artikel (atau hanya metadata <head> jika metadata_only)"""
+        response = self.download_article(url)
+        if response is None:
+            return None
+        
+        try:
+            article = self.parse_response(response, url, metadata_only)
+        except Exception as e:
+            print(f"   Error mengambil detail artikel: {str(e)}")
+            return None
+        return self.complete_article(article)
+    
+    def download_article(self, url):
+        """Unduh halaman artikel (tahap I/O, tanpa parsing); None jika gagal"""
         print(f"   Mengambil detail: {url}")
         
         try:
-            response = requests.get(url, headers=self.headers, timeout=15)
+            response = self.fetch(url, timeout=15)
             response.raise_for_status()
+            return response
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+        except Exception as e:
+            print(f"   Error mengambil detail artikel: {str(e)}")
+            return None
+    
+    def get_article_details(self, urls, max_workers=None, metadata_only=False):
+        """
+        Ambil detail banyak artikel secara paralel
+        
+        Args:
+            urls: List URL artikel
+            max_workers: Jumlah worker paralel (default: None = self.max_workers)
+            metadata_only: Hanya metadata dari <head>, tanpa isi artikel
             
-            # Extract title
+        Returns:
+            List detail artikel sesuai urutan urls (None untuk yang gagal)
+        """
+        return list(self.iter_article_details(urls, max_workers=max_workers, metadata_only=metadata_only))
+    
+    def iter_article_details(self, urls, max_workers=None, window=None, metadata_only=False):
+        """
+        Seperti get_article_details, tetapi hasil di-yield satu per satu sesuai urutan urls.
+        Maksimal `window` request berjalan/menunggu sekaligus (default: 2x jumlah worker).
+        """
+        workers = max(1, max_workers or self.max_workers)
+        if self.parse_workers and len(urls) > 1:
+            # Unduh di thread, parse di proses terpisah (antrian terbatas `window`)
+            pipeline = ParsePipeline(self, io_workers=workers, parse_workers=self.parse_workers, queue_size=window)
+            yield from pipeline.iter_article_details(urls, metadata_only)
+            return
+        
+        if workers == 1 or len(urls) <= 1:
+            for url in urls:
+                yield self.get_article_detail(url, metadata_only)
+            return
+        
+        window = max(workers, window or workers * 2)
+        with ThreadPoolExecutor(max_workers=min(workers, len(urls))) as executor:
+            in_flight = deque()
+            for url in urls:
+                in_flight.append(executor.submit(self.get_article_detail, url, metadata_only))
+                if len(in_flight) >= window:
+                    yield in_flight.popleft().result()
+            while in_flight:
+                yield in_flight.popleft().result()
+    
+    def mark_failed(self, article):
+        """Isi data dasar untuk artikel yang gagal diambil detailnya"""
+        article['content'] = "Gagal mengambil konten"
+        article['author'] = ""
+        article['date_published'] = article['date']
+        article['categories'] = article['category']
+        article['tags'] = ""
+        article['total_pages'] = 1
+        article['multi_page'] = False
+        return article
+    
+    def response_soup(self, response, encoding=UNRESOLVED):
+        """Parse byte mentah respons (requests/httpx) menjadi BeautifulSoup"""
+        return soup_from_response(response, self.parser_backend, encodings=self.encodings,
+                                  encoding=encoding)
+    
+    def response_metadata(self, response, encoding=UNRESOLVED):
+        """Metadata artikel dari <head> respons, tanpa membangun DOM body"""
+        if encoding is UNRESOLVED:
+            encoding = self.encodings.encoding_for(response)
+        return extract_head_metadata(response.content, self.parser_backend, from_encoding=encoding)
+    
+    def search_soup(self, response):
+        """Parse halaman pencarian secara parsial (hanya daftar artikel dan pagination)"""
+        return soup_from_response(response, self.parser_backend, parse_only=SEARCH_PAGE_STRAINER,
+                             encodings=self.encodings)
+    
+    def parse_response(self, response, url, metadata_only=False):
+        """
+        Parse respons halaman artikel: metadata dari <head> lebih dulu, DOM lengkap
+        hanya dibangun untuk field yang tidak tersedia di sana (konten, dll)
+        """
+        # Encoding dicari sekali, dipakai untuk parse <head> dan DOM
+        encoding = self.encodings.encoding_for(response)
+        metadata = self.metadata_fields(self.response_metadata(response, encoding))
+        if metadata_only:
+            return self.metadata_record(metadata)
+        
+        soup = self.response_soup(response, encoding)
+        # Link halaman lain dicari sebelum parse_article membersihkan isi artikel
+        page_urls = self.extract_page_urls(soup, url)
+        article = self.parse_article(soup, url, metadata)
+        if page_urls:
+            article['total_pages'] = len(page_urls) + 1
+            article['multi_page'] = True
+            # Diambil oleh complete_article (tahap I/O), lalu dibuang dari record
+            article['_page_urls'] = page_urls
+        return article
+    
+    def format_date(self, value):
+        """Tanggal metadata (ISO) ke format halaman Detik, mis. 'Selasa, 02 Jan 2024 10:00 WIB'"""
+        published = parse_datetime(value)
+        if not published:
+            return ''
+        if published.tzinfo:
+            published = published.astimezone(WIB)
+        return (f"{DAY_NAMES[published.weekday()]}, {published.day:02d} "
+                f"{MONTH_NAMES[published.month - 1]} {published.year} {published:%H:%M} WIB")
+    
+    def metadata_fields(self, metadata):
+        """Petakan metadata <head> ke field artikel Detik"""
+        fields = {}
+        if metadata.get('title'):
+            fields['title'] = metadata['title']
+        if metadata.get('author'):
+            fields['author'] = ', '.join(metadata['author'])
+        date_published = self.format_date(metadata.get('date_published'))
+        if date_published:
+            fields['date_published'] = date_published
+        if metadata.get('section'):
+            fields['categories'] = metadata['section']
+        if metadata.get('keywords'):
+            fields['tags'] = ', '.join(dict.fromkeys(metadata['keywords']))
+        return fields
+    
+    def metadata_record(self, fields):
+        """Record artikel dari metadata saja (tanpa konten), kolom sama dengan parse_article"""
+        article = Article(
+            title='',
+            author='',
+            date_published='',
+            content='',
+            categories='',
+            tags='',
+            total_pages=1,
+            multi_page=False
+        )
+        article.update(fields)
+        return article
+    
+    def parse_article(self, soup, url, metadata=None):
+        """
+        Ekstrak semua field artikel dari halaman detail yang sudah di-parse.
+        Judul dan tanggal dari `metadata` (lihat metadata_fields) dipakai jika ada,
+        sehingga extractor DOM hanya jalan untuk yang kosong. Penulis tetap dari
+        DOM (format 'Nama - detikKanal' / nama kolumnis); metadata hanya cadangan.
+        """
+        metadata = metadata or {}
+        
+        # Extract title
+        title = metadata.get('title', '')
+        if not title:
             title_elem = soup.find('h1', class_='detail__title')
             title = title_elem.get_text(strip=True) if title_elem else ''
-            
-            # Extract author (bisa dari box-kolumnis atau byline lain)
-            author = ''
-            # Cek kolumnis box
-            author_elem = soup.find('div', class_='box-kolumnis__desc')
-            if author_elem:
-                author_name = author_elem.find('h5')
-                if author_name:
-                    author = author_name.get_text(strip=True)
-            
-            # Jika tidak ada, cek struktur lain
-            if not author:
-                byline = soup.find('div', class_='detail__author')
-                if byline:
-                    author = byline.get_text(strip=True)
-            
-            # Extract date
+        
+        # Extract author (bisa dari box-kolumnis atau byline lain)
+        author = ''
+        # Cek kolumnis box
+        author_elem = soup.find('div', class_='box-kolumnis__desc')
+        if author_elem:
+            author_name = author_elem.find('h5')
+            if author_name:
+                author = author_name.get_text(strip=True)
+        
+        # Jika tidak ada, cek struktur lain
+        if not author:
+            byline = soup.find('div', class_='detail__author')
+            if byline:
+                author = byline.get_text(strip=True)
+        
+        if not author:
+            author = metadata.get('author', '')
+        
+        # Extract date
+        date_published = metadata.get('date_published', '')
+        if not date_published:
             date_elem = soup.find('div', class_='detail__date')
             date_published = date_elem.get_text(strip=True) if date_elem else ''
-            
-            # Extract content
-            content_elem = soup.find('div', class_='detail__body-text')
-            if content_elem:
-                # Remove script dan style tags
-                for script in content_elem(['script', 'style', 'ins', 'div']):
-                    script.decompose()
-                
-                # Ambil semua paragraf
-                paragraphs = content_elem.find_all(['p', 'strong'])
-                content = '\n\n'.join([p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True)])
-            else:
-                content = ''
-            
-            # Extract tags
-            tags = []
-            tag_container = soup.find('div', class_='detail__body-tag')
-            if tag_container:
-                tag_links = tag_container.find_all('a', class_='nav__item')
-                tags = [tag.get_text(strip=True) for tag in tag_links]
-            
-            # Extract category
-            category_elem = soup.find('h2', class_='detail__subtitle')
-            category = category_elem.get_text(strip=True) if category_elem else ''
-            
-            return {
-                'title': title,
-                'author': author,
-                'date_published': date_published,
-                'content': content,
-                'categories': category,
-                'tags': ', '.join(tags),
-                'total_pages': 1,
-                'multi_page': False
-            }
-            
+        
+        # Extract content
+        content = self.extract_content(soup)
+        
+        # Extract tags
+        tags = []
+        tag_container = soup.find('div', class_='detail__body-tag')
+        if tag_container:
+            tag_links = tag_container.find_all('a', class_='nav__item')
+            tags = [tag.get_text(strip=True) for tag in tag_links]
+        
+        # Extract category
+        category_elem = soup.find('h2', class_='detail__subtitle')
+        category = category_elem.get_text(strip=True) if category_elem else ''
+        
+        return Article(
+            title=title,
+            author=author,
+            date_published=date_published,
+            content=content,
+            categories=category,
+            tags=', '.join(tags),
+            total_pages=1,
+            multi_page=False
+        )
+    
+    def extract_content(self, soup):
+        """Ekstrak isi artikel (satu halaman) dari div.detail__body-text"""
+        content_elem = soup.find('div', class_='detail__body-text')
+        if not content_elem:
+            return ''
+        
+        # Remove script dan style tags
+        for script in content_elem(['script', 'style', 'ins', 'div']):
+            script.decompose()
+        
+        # Ambil semua paragraf
+        paragraphs = content_elem.find_all(['p', 'strong'])
+        return '\n\n'.join([p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True)])
+    
+    def extract_page_urls(self, soup, url):
+        """URL halaman 2..N artikel multi-halaman dari navigasi halaman (urut, tanpa halaman ini)"""
+        current = url.rstrip('/')
+        page_urls = []
+        for link in soup.find_all('a', class_='detail__anchor-numb'):
+            href = link.get('href')
+            number = link.get_text(strip=True)
+            if not href or not number.isdigit() or number == '1':
+                continue
+            page_url = urljoin(url, href)
+            if page_url.rstrip('/') != current and page_url not in page_urls:
+                page_urls.append(page_url)
+        return page_urls
+    
+    def get_page_content(self, url):
+        """Ambil isi satu halaman lanjutan artikel multi-halaman ('' jika gagal)"""
+        response = self.download_article(url)
+        if response is None:
+            return ''
+        try:
+            return self.extract_content(self.response_soup(response))
         except Exception as e:
-            print(f"   Error mengambil detail artikel: {str(e)}")
-            return None
+            print(f"   Error mengambil halaman artikel: {str(e)}")
+            return ''
     
-    def save_to_excel(self, articles, filename):
-        """Menyimpan data ke Excel"""
-        df = pd.DataFrame(articles)
+    def complete_article(self, article):
+        """
+        Lengkapi artikel multi-halaman: halaman 2..N (ditemukan saat parsing)
+        diambil paralel lalu kontennya digabung sesuai urutan halaman
+        """
+        page_urls = article.pop('_page_urls', None)
+        if not page_urls:
+            return article
         
-        # Reorder columns
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(page_urls))) as executor:
+            contents = list(executor.map(self.get_page_content, page_urls))
+        return self.merge_pages(article, contents)
+    
+    def merge_pages(self, article, contents):
+        """Gabungkan konten halaman 2..N ke artikel"""
+        parts = [article['content']] + list(contents)
+        article['content'] = '\n\n'.join(part for part in parts if part)
+        return article
+    
+    def save_to_excel(self, articles, filename):
+        """Menyimpan data ke Excel (streaming, write-only; path atau stream biner)"""
+        # Kolom tetap: artikel dibaca sekali saja (boleh generator)
         columns_order = ['title', 'url', 'category', 'date', 'date_published', 
                         'author', 'description', 'content', 'categories', 'tags']
+        rows = ([article.get(col) for col in columns_order] for article in articles)
         
-        # Only include columns that exist
-        columns_order = [col for col in columns_order if col in df.columns]
-        df = df[columns_order]
-        
-        df.to_excel(filename, index=False, engine='openpyxl')
-        print(f"Data disimpan ke Excel: {filename}")
+        exporters.save_to_excel(rows, filename, columns_order)
+        print(f"Data disimpan ke Excel: {exporters.target_name(filename)}")
         
     def save_to_json(self, articles, filename):
-        """Menyimpan data ke JSON"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(articles, f, ensure_ascii=False, indent=2)
-        print(f"Data disimpan ke JSON: {filename}")
+        """
+        Menyimpan data ke JSON (satu array, ditulis per artikel)
+        
+        Args:
+            articles: List atau generator artikel
+            filename: Nama file (.json) atau stream biner
+        """
+        count = exporters.save_to_json(articles, filename)
+        print(f"Data disimpan ke JSON: {exporters.target_name(filename)} ({count} artikel)")
+        return count
+        
+    def save_to_jsonl(self, articles, filename, compression=None):
+        """
+        Menyimpan data ke JSON Lines secara streaming (satu artikel per baris)
+        
+        Args:
+            articles: List atau generator artikel
+            filename: Nama file (.jsonl, .jsonl.gz, .jsonl.zst) atau stream biner
+            compression: None/'gzip'/'zstd' (default: dari ekstensi file)
+        """
+        count = exporters.save_to_jsonl(articles, filename, compression)
+        print(f"Data disimpan ke JSONL: {exporters.target_name(filename)} ({count} artikel)")
+        return count
+        
+    def save_to_parquet(self, articles, filename):
+        """
+        Menyimpan data ke Parquet (skema tetap, zstd, ditulis per row group)
+        
+        Args:
+            articles: List atau generator artikel
+            filename: Nama file (.parquet) atau stream biner
+        """
+        count = exporters.save_to_parquet(articles, filename, source='Detik')
+        print(f"Data disimpan ke Parquet: {exporters.target_name(filename)} ({count} artikel)")
+        return count
+        
+    def save_to_store(self, articles, store=None):
+        """
+        Menyimpan data ke arsip SQLite dengan indeks full-text (lihat article_store)
+        
+        Args:
+            articles: List atau generator artikel
+            store: ArticleStore (default: arsip bersama di .cache/articles.sqlite)
+        """
+        store = store or get_default_store()
+        count = store.add_many((article for article in articles if article.get('url')), source='Detik')
+        print(f"Data disimpan ke arsip: {store.path} ({count} artikel)")
+        return count
         
     def save_to_txt(self, articles, filename):
-        """Menyimpan data ke TXT"""
-        with open(filename, 'w', encoding='utf-8') as f:
+        """Menyimpan data ke TXT (path atau stream biner)"""
+        with exporters.open_text(filename) as f:
             for i, article in enumerate(articles, 1):
                 f.write(f"{'='*80}\n")
                 f.write(f"ARTIKEL {i}\n")
@@ -245,4 +600,4 @@ class DetikScraper:
                 f.write(f"Konten:\n{article.get('content', '')}\n\n")
                 f.write("\n\n")
         
-        print(f"Data disimpan ke TXT: {filename}")
+        print(f"Data disimpan ke TXT: {exporters.target_name(filename)}")
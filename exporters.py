@@ -0,0 +1,417 @@
+"""
+Exporters Module
+Writer/reader streaming untuk hasil scraping: JSON Lines (satu record
+ringkas per baris) dengan kompresi gzip/zstd opsional, array JSON yang
+ditulis per elemen, Excel write-only
+(baris ditulis langsung ke file, lebar kolom dari sampel baris awal), dan
+Parquet kolumnar (skema tetap, zstd, per row group) beserta loader-nya.
+Semua writer menerima path atau stream biner (BytesIO, entry ZIP) sebagai
+tujuan; stream milik pemanggil tidak ditutup.
+"""
+
+import contextlib
+import gzip
+import io
+import json
+import os
+from datetime import timedelta, timezone
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+from openpyxl.utils import get_column_letter
+
+from article import json_default
+from metadata import parse_article_date
+
+# Jumlah baris awal yang dipakai untuk memperkirakan lebar kolom Excel
+EXCEL_SAMPLE_ROWS = 500
+EXCEL_MAX_WIDTH = 50
+
+# Kolom export Parquet (urutan skema); date_published disimpan sebagai timestamp WIB
+PARQUET_COLUMNS = ['title', 'url', 'date_published', 'author', 'categories', 'tags', 'content', 'source']
+PARQUET_ROW_GROUP_SIZE = 1000
+PARQUET_TIMEZONE = '+07:00'
+WIB = timezone(timedelta(hours=7))
+
+
+def is_stream(target):
+    """True jika tujuan berupa stream biner (punya write), bukan path"""
+    return hasattr(target, 'write')
+
+
+def target_name(target):
+    """Nama tujuan untuk log: path, atau nama stream jika ada"""
+    if is_stream(target):
+        return getattr(target, 'name', '<buffer>')
+    return target
+
+
+def detect_compression(filename, compression=None):
+    """Tentukan kompresi dari argumen atau ekstensi file (.gz / .zst)"""
+    if compression or is_stream(filename):
+        return compression
+    if filename.endswith('.gz'):
+        return 'gzip'
+    if filename.endswith('.zst'):
+        return 'zstd'
+    return None
+
+
+def open_binary(filename, mode, compression=None):
+    """
+    Buka file biner dengan kompresi gzip/zstd opsional
+
+    `filename` boleh berupa stream biner; stream tanpa kompresi dikembalikan
+    apa adanya, dan lapisan kompresi di atasnya tidak menutup stream tersebut.
+    """
+    if is_stream(filename):
+        return wrap_stream(filename, mode, compression)
+
+    if mode == 'wb':
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    compression = detect_compression(filename, compression)
+    if compression is None:
+        return open(filename, mode)
+    if compression == 'gzip':
+        return gzip.open(filename, mode)
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("Kompresi zstd membutuhkan paket 'zstandard' (pip install zstandard)")
+        if mode == 'wb':
+            return zstandard.ZstdCompressor().stream_writer(open(filename, 'wb'), closefd=True)
+        return zstandard.ZstdDecompressor().stream_reader(open(filename, 'rb'), closefd=True)
+    raise ValueError(f"Kompresi tidak dikenal: {compression}")
+
+
+def wrap_stream(stream, mode, compression=None):
+    """Lapisan kompresi gzip/zstd di atas stream milik pemanggil"""
+    if compression is None:
+        return stream
+    if compression == 'gzip':
+        return gzip.GzipFile(fileobj=stream, mode=mode)
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("Kompresi zstd membutuhkan paket 'zstandard' (pip install zstandard)")
+        if mode == 'wb':
+            return zstandard.ZstdCompressor().stream_writer(stream, closefd=False)
+        return zstandard.ZstdDecompressor().stream_reader(stream, closefd=False)
+    raise ValueError(f"Kompresi tidak dikenal: {compression}")
+
+
+@contextlib.contextmanager
+def open_text(target):
+    """File teks UTF-8 untuk ditulis: path (direktori dibuat) atau stream biner (tidak ditutup)"""
+    if is_stream(target):
+        text = io.TextIOWrapper(target, encoding='utf-8')
+        try:
+            yield text
+        finally:
+            text.detach()
+        return
+
+    directory = os.path.dirname(target)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(target, 'w', encoding='utf-8') as f:
+        yield f
+
+
+class JsonlWriter:
+    """Tulis artikel satu per satu sebagai JSON Lines, memori tetap datar"""
+
+    def __init__(self, filename, compression=None):
+        self.filename = filename
+        self.file = open_binary(filename, 'wb', compression)
+        self.count = 0
+
+    def write(self, article):
+        line = json.dumps(article, ensure_ascii=False, separators=(',', ':'), default=json_default)
+        self.file.write(line.encode('utf-8') + b'\n')
+        self.count += 1
+
+    def write_all(self, articles):
+        for article in articles:
+            self.write(article)
+        return self.count
+
+    def close(self):
+        if self.file is self.filename:
+            # Stream milik pemanggil
+            self.file.flush()
+        else:
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def save_to_jsonl(articles, filename, compression=None):
+    """
+    Simpan artikel (list atau generator) ke JSON Lines
+
+    Args:
+        filename: Path atau stream biner (kompresi stream harus disebutkan)
+
+    Returns:
+        Jumlah record yang ditulis
+    """
+    with JsonlWriter(filename, compression) as writer:
+        return writer.write_all(articles)
+
+
+def read_jsonl(filename, compression=None):
+    """Baca JSON Lines satu record per iterasi (generator)"""
+    with open_binary(filename, 'rb', compression) as f:
+        for line in io.TextIOWrapper(f, encoding='utf-8'):
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def save_to_json(articles, filename, indent=2):
+    """
+    Simpan artikel (list atau generator) sebagai satu array JSON, ditulis
+    elemen per elemen; hasilnya sama dengan json.dump(list(articles), indent=indent)
+
+    Args:
+        filename: Path atau stream biner
+
+    Returns:
+        Jumlah record yang ditulis
+    """
+    pad = ' ' * indent
+    count = 0
+    with open_text(filename) as f:
+        for article in articles:
+            item = json.dumps(article, ensure_ascii=False, indent=indent, default=json_default)
+            f.write(',\n' if count else '[\n')
+            f.write(pad + item.replace('\n', '\n' + pad))
+            count += 1
+        f.write('\n]' if count else '[]')
+    return count
+
+
+def column_widths(headers, rows, max_width=EXCEL_MAX_WIDTH):
+    """Lebar kolom: teks terpanjang di header/baris sampel + 2, maksimal max_width"""
+    widths = [len(str(header)) for header in headers]
+    for row in rows:
+        for index, value in enumerate(row):
+            if value is not None:
+                widths[index] = max(widths[index], len(str(value)))
+    return [min(width + 2, max_width) for width in widths]
+
+
+class ExcelWriter:
+    """
+    Tulis baris ke .xlsx secara streaming (openpyxl write-only)
+
+    Lebar kolom harus ditetapkan sebelum baris pertama ditulis, jadi hanya
+    `sample_rows` baris awal yang ditahan di memori untuk mengukurnya; baris
+    sesudahnya langsung diteruskan ke file.
+    """
+
+    def __init__(self, filename, headers, sheet_name='Sheet1', sample_rows=EXCEL_SAMPLE_ROWS,
+                 max_width=EXCEL_MAX_WIDTH):
+        directory = '' if is_stream(filename) else os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.filename = filename
+        self.headers = list(headers)
+        self.sample_rows = max(1, sample_rows)
+        self.max_width = max_width
+        self.workbook = Workbook(write_only=True)
+        self.sheet = self.workbook.create_sheet(sheet_name)
+        self.pending = []
+        self.started = False
+        self.count = 0
+
+    def write(self, row):
+        self.count += 1
+        if self.started:
+            self.sheet.append(row)
+            return
+        self.pending.append(list(row))
+        if len(self.pending) >= self.sample_rows:
+            self.flush_sample()
+
+    def write_all(self, rows):
+        for row in rows:
+            self.write(row)
+        return self.count
+
+    def flush_sample(self):
+        """Tetapkan lebar kolom dari sampel, lalu tulis header dan baris sampel"""
+        widths = column_widths(self.headers, self.pending, self.max_width)
+        for index, width in enumerate(widths, 1):
+            self.sheet.column_dimensions[get_column_letter(index)].width = width
+
+        header = []
+        for title in self.headers:
+            cell = WriteOnlyCell(self.sheet, value=title)
+            cell.font = Font(bold=True)
+            header.append(cell)
+        self.sheet.append(header)
+
+        for row in self.pending:
+            self.sheet.append(row)
+        self.pending = []
+        self.started = True
+
+    def close(self):
+        if not self.started:
+            self.flush_sample()
+        self.workbook.save(self.filename)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        # Jangan simpan file setengah jadi jika penulisan gagal
+        if exc_type is None:
+            self.close()
+
+
+def save_to_excel(rows, filename, headers, sheet_name='Sheet1'):
+    """
+    Simpan baris (list atau generator list nilai) ke Excel secara streaming
+
+    Args:
+        filename: Path atau stream biner
+
+    Returns:
+        Jumlah baris data yang ditulis
+    """
+    with ExcelWriter(filename, headers, sheet_name) as writer:
+        return writer.write_all(rows)
+
+
+def import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("Export Parquet membutuhkan paket 'pyarrow' (pip install pyarrow)")
+    return pyarrow, pyarrow.parquet
+
+
+def parquet_schema():
+    """Skema tetap export Parquet"""
+    pa, _ = import_pyarrow()
+    return pa.schema([
+        (name, pa.timestamp('ms', tz=PARQUET_TIMEZONE) if name == 'date_published' else pa.string())
+        for name in PARQUET_COLUMNS
+    ])
+
+
+def parquet_record(article, source=None):
+    """Artikel -> dict sesuai PARQUET_COLUMNS (tanggal yang tidak bisa di-parse menjadi null)"""
+    published = parse_article_date(article.get('date_published') or article.get('date'))
+    if published and published.tzinfo is None:
+        published = published.replace(tzinfo=WIB)
+
+    def text(*keys):
+        for key in keys:
+            value = article.get(key)
+            if value:
+                return str(value)
+        return None
+
+    return {
+        'title': text('title'),
+        'url': text('url'),
+        'date_published': published,
+        'author': text('author'),
+        'categories': text('categories', 'category'),
+        'tags': text('tags'),
+        'content': text('content'),
+        'source': text('source') or source,
+    }
+
+
+class ParquetWriter:
+    """
+    Tulis artikel ke Parquet (skema tetap, kompresi zstd) secara streaming
+
+    Artikel dikumpulkan sampai `row_group_size` lalu ditulis sebagai satu row
+    group, jadi memori tetap datar untuk korpus sebesar apa pun.
+    """
+
+    def __init__(self, filename, source=None, row_group_size=PARQUET_ROW_GROUP_SIZE, compression='zstd'):
+        pa, pq = import_pyarrow()
+        directory = '' if is_stream(filename) else os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.pa = pa
+        self.filename = filename
+        self.source = source
+        self.row_group_size = max(1, row_group_size)
+        self.schema = parquet_schema()
+        self.writer = pq.ParquetWriter(filename, self.schema, compression=compression)
+        self.pending = []
+        self.count = 0
+
+    def write(self, article):
+        self.pending.append(parquet_record(article, self.source))
+        self.count += 1
+        if len(self.pending) >= self.row_group_size:
+            self.flush()
+
+    def write_all(self, articles):
+        for article in articles:
+            self.write(article)
+        return self.count
+
+    def flush(self):
+        """Tulis artikel yang tertunda sebagai satu row group"""
+        if self.pending:
+            self.writer.write_batch(self.pa.RecordBatch.from_pylist(self.pending, schema=self.schema))
+            self.pending = []
+
+    def close(self):
+        self.flush()
+        self.writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def save_to_parquet(articles, filename, source=None, row_group_size=PARQUET_ROW_GROUP_SIZE):
+    """
+    Simpan artikel (list atau generator) ke Parquet
+
+    Args:
+        filename: Path atau stream biner
+        source: Nilai kolom source untuk artikel yang tidak membawanya (mis. 'Kompas')
+
+    Returns:
+        Jumlah record yang ditulis
+    """
+    with ParquetWriter(filename, source, row_group_size) as writer:
+        return writer.write_all(articles)
+
+
+def load_parquet(filename, columns=None, filters=None):
+    """
+    Baca export Parquet sebagai DataFrame; hanya kolom yang diminta yang dibaca
+
+    Args:
+        filename: Path atau stream biner
+        columns: Daftar kolom (default: semua), mis. ['title', 'date_published']
+        filters: Filter baris pyarrow, mis. [('source', '=', 'Kompas')]
+    """
+    _, pq = import_pyarrow()
+    return pq.read_table(filename, columns=columns, filters=filters).to_pandas()
@@ -0,0 +1,199 @@
+"""
+HTML Parser Module
+Pilihan backend parser untuk BeautifulSoup (lxml atau html.parser) dan
+pengecekan paritas hasil ekstraksi antar backend, antara metadata <head> dan
+DOM, serta antara parse parsial (strainer) dan DOM lengkap.
+
+Pemakaian CLI (cek paritas satu file HTML):
+    python html_parser.py kompas artikel.html https://www.kompas.com/read/...
+    python html_parser.py detik pencarian.html --search
+"""
+
+import inspect
+import re
+import sys
+
+from bs4 import BeautifulSoup
+
+# Urutan preferensi: lxml (parser C, jauh lebih cepat) lalu html.parser (bawaan Python)
+BACKENDS = ('lxml', 'html.parser')
+
+
+def available_backends():
+    """Backend yang terpasang di environment ini"""
+    backends = []
+    for backend in BACKENDS:
+        if backend == 'lxml':
+            try:
+                import lxml  # noqa: F401
+            except ImportError:
+                continue
+        backends.append(backend)
+    return backends
+
+
+def default_backend():
+    """Backend tercepat yang tersedia"""
+    return available_backends()[0]
+
+
+def make_soup(markup, backend=None, parse_only=None, from_encoding=None):
+    """
+    Parse HTML (str atau bytes) menjadi BeautifulSoup
+
+    Args:
+        markup: Isi HTML
+        backend: 'lxml' atau 'html.parser' (default: tercepat yang tersedia)
+        parse_only: SoupStrainer untuk parsing sebagian dokumen
+        from_encoding: Encoding markup bytes yang sudah diketahui (lewati deteksi)
+    """
+    if isinstance(markup, str):
+        from_encoding = None
+    return BeautifulSoup(markup, backend or default_backend(), parse_only=parse_only,
+                         from_encoding=from_encoding)
+
+
+def class_pattern(*names):
+    """
+    Pola atribut class untuk SoupStrainer: cocok jika salah satu `names` ada di
+    antara token class elemen. SoupStrainer(class_=[...]) membandingkan string
+    class utuh, sehingga elemen dengan lebih dari satu class akan terlewat.
+    """
+    alternatives = '|'.join(re.escape(name) for name in names)
+    return re.compile(rf'(?:^|\s)(?:{alternatives})(?:\s|$)')
+
+
+def field_extractors(scraper):
+    """
+    parse_article dan setiap method extract_* yang menerima soup
+
+    Returns:
+        List (nama, fungsi(soup, url))
+    """
+    extractors = [('parse_article', scraper.parse_article)]
+    for name, method in inspect.getmembers(scraper, inspect.ismethod):
+        if not name.startswith('extract_') or name == 'extract_search_result':
+            continue
+        params = list(inspect.signature(method).parameters)
+        if params[:1] != ['soup']:
+            continue
+        if len(params) > 1:
+            extractors.append((name, method))
+        else:
+            extractors.append((name, lambda soup, url, method=method: method(soup)))
+    return extractors
+
+
+def extract_fields(scraper, soup, url):
+    """Jalankan parse_article dan setiap method extract_* yang menerima soup"""
+    return {name: extractor(soup, url) for name, extractor in field_extractors(scraper)}
+
+
+def compare_backends(scraper, markup, url, backends=None):
+    """
+    Bandingkan hasil ekstraksi artikel di semua backend
+
+    Returns:
+        Dict nama_field -> {backend: nilai} untuk field yang berbeda
+        (dict kosong berarti semua backend identik)
+    """
+    backends = backends or available_backends()
+    results = {
+        backend: extract_fields(scraper, make_soup(markup, backend), url)
+        for backend in backends
+    }
+
+    differences = {}
+    reference = results[backends[0]]
+    for field in reference:
+        values = {backend: results[backend][field] for backend in backends}
+        if any(value != reference[field] for value in values.values()):
+            differences[field] = values
+    return differences
+
+
+def compare_search_backends(scraper, markup, backends=None):
+    """Bandingkan hasil parse_search_page di semua backend (dict kosong = identik)"""
+    backends = backends or available_backends()
+    results = {
+        backend: scraper.parse_search_page(make_soup(markup, backend))
+        for backend in backends
+    }
+    reference = results[backends[0]]
+    if all(value == reference for value in results.values()):
+        return {}
+    return {'parse_search_page': results}
+
+
+def compare_head_metadata(scraper, markup, url, backend=None):
+    """
+    Bandingkan parse_response (metadata <head> + DOM) dengan extractor DOM saja
+    (parse_article tanpa metadata)
+
+    Returns:
+        Dict nama_field -> {'response': nilai, 'dom': nilai} untuk field yang berbeda
+    """
+    from parse_pool import build_response
+
+    backend = backend or scraper.parser_backend
+    response = scraper.parse_response(build_response(url, markup, 'utf-8'), url)
+    dom = scraper.parse_article(make_soup(markup, backend, from_encoding='utf-8'), url)
+    return {
+        field: {'response': response.get(field), 'dom': dom.get(field)}
+        for field in dict.fromkeys(list(dom) + list(response))
+        if response.get(field) != dom.get(field)
+    }
+
+
+def compare_search_strainer(scraper, markup, url='', backend=None):
+    """
+    Bandingkan halaman pencarian yang di-parse sebagian (search_soup dengan
+    strainer) dengan DOM lengkap: parse_search_page dan get_total_pages
+
+    Returns:
+        Dict nama -> {'strainer': nilai, 'full': nilai} untuk yang berbeda
+        (dict kosong = identik)
+    """
+    from parse_pool import build_response
+
+    backend = backend or scraper.parser_backend
+    soups = {
+        'strainer': lambda: scraper.search_soup(build_response(url, markup, 'utf-8')),
+        'full': lambda: make_soup(markup, backend, from_encoding='utf-8'),
+    }
+    differences = {}
+    for name in ('parse_search_page', 'get_total_pages'):
+        values = {kind: getattr(scraper, name)(soup()) for kind, soup in soups.items()}
+        if values['strainer'] != values['full']:
+            differences[name] = values
+    return differences
+
+
+if __name__ == '__main__':
+    from scrapers import create_scraper
+
+    if len(sys.argv) < 3:
+        print("Pemakaian: python html_parser.py <kompas|detik> <file.html> [url] [--search]")
+        sys.exit(2)
+
+    source, path = sys.argv[1], sys.argv[2]
+    url = sys.argv[3] if len(sys.argv) > 3 and not sys.argv[3].startswith('--') else ''
+    scraper = create_scraper(source.capitalize(), cache=None)
+    with open(path, 'rb') as f:
+        markup = f.read()
+
+    if '--search' in sys.argv:
+        differences = compare_search_backends(scraper, markup)
+        differences.update(compare_search_strainer(scraper, markup, url))
+    else:
+        differences = compare_backends(scraper, markup, url)
+        differences.update(compare_head_metadata(scraper, markup, url))
+
+    if not differences:
+        print(f"Identik di semua backend ({', '.join(available_backends())}) dan jalur parsing")
+        sys.exit(0)
+    for field, values in differences.items():
+        print(f"[BERBEDA] {field}")
+        for backend, value in values.items():
+            print(f"   {backend}: {value!r}")
+    sys.exit(1)
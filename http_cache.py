@@ -0,0 +1,279 @@
+"""
+HTTP Cache Module
+Cache respons HTTP di disk (SQLite) untuk scraper: dikunci dengan URL yang
+dinormalisasi, punya TTL, dibatasi ukuran dengan eviction LRU, dan entry yang
+kadaluarsa divalidasi ulang dengan If-None-Match / If-Modified-Since.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import urlencode, urlsplit, urlunsplit, parse_qsl
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+DEFAULT_CACHE_PATH = os.path.join('.cache', 'http_cache.sqlite')
+
+
+def normalize_url(url, params=None):
+    """Normalisasi URL (+ params) menjadi kunci cache yang stabil"""
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    port = parts.port
+    if port and not ((scheme == 'http' and port == 80) or (scheme == 'https' and port == 443)):
+        host = f"{host}:{port}"
+
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if params:
+        items = params.items() if isinstance(params, dict) else params
+        query.extend((str(key), str(value)) for key, value in items if value is not None)
+    query.sort()
+
+    return urlunsplit((scheme, host, parts.path or '/', urlencode(query), ''))
+
+
+class CacheEntry:
+    def __init__(self, url, status, headers, body, stored_at):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.stored_at = stored_at
+
+    def validators(self):
+        """Header kondisional untuk validasi ulang entry ini"""
+        headers = {}
+        if self.headers.get('etag'):
+            headers['If-None-Match'] = self.headers['etag']
+        if self.headers.get('last-modified'):
+            headers['If-Modified-Since'] = self.headers['last-modified']
+        return headers
+
+
+class HttpCache:
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl=6 * 3600, max_bytes=500 * 1024 * 1024):
+        """
+        Args:
+            path: Lokasi file SQLite cache
+            ttl: Umur entry (detik) sebelum perlu validasi ulang
+            max_bytes: Ukuran total body maksimal sebelum entry lama dibuang (LRU)
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT,
+                status INTEGER,
+                headers TEXT,
+                body BLOB,
+                size INTEGER,
+                stored_at REAL,
+                accessed_at REAL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_accessed ON responses (accessed_at)")
+        self.conn.commit()
+        self.total_bytes = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+        # Statistik
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Ambil entry cache (atau None) dan catat waktu aksesnya"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT url, status, headers, body, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self.conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            self.conn.commit()
+
+        url, status, headers, body, stored_at = row
+        return CacheEntry(url, status, json.loads(headers), body, stored_at)
+
+    def put(self, key, url, status, headers, body):
+        """Simpan respons, lalu buang entry paling lama tidak diakses jika melebihi max_bytes"""
+        now = time.time()
+        headers = {name.lower(): value for name, value in headers.items()}
+        with self.lock:
+            old = self.conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            if old:
+                self.total_bytes -= old[0]
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, status, json.dumps(headers), body, len(body), now, now)
+            )
+            self.total_bytes += len(body)
+            self.evict()
+            self.conn.commit()
+
+    def refresh(self, key, headers):
+        """Perbarui waktu simpan setelah server menjawab 304 Not Modified"""
+        with self.lock:
+            row = self.conn.execute("SELECT headers FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return
+            stored = json.loads(row[0])
+            for name in ('etag', 'last-modified', 'date', 'cache-control', 'expires'):
+                if name in headers:
+                    stored[name] = headers[name]
+            now = time.time()
+            self.conn.execute(
+                "UPDATE responses SET headers = ?, stored_at = ?, accessed_at = ? WHERE key = ?",
+                (json.dumps(stored), now, now, key)
+            )
+            self.conn.commit()
+
+    def evict(self):
+        """Buang entry LRU sampai total ukuran di bawah batas (lock harus dipegang)"""
+        while self.total_bytes > self.max_bytes:
+            rows = self.conn.execute(
+                "SELECT key, size FROM responses ORDER BY accessed_at LIMIT 50"
+            ).fetchall()
+            if not rows:
+                self.total_bytes = 0
+                break
+            for key, size in rows:
+                self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.total_bytes -= size
+                if self.total_bytes <= self.max_bytes:
+                    break
+
+    def clear(self):
+        """Hapus semua entry cache"""
+        with self.lock:
+            self.conn.execute("DELETE FROM responses")
+            self.conn.commit()
+            self.total_bytes = 0
+
+    def stats(self):
+        """Statistik cache"""
+        with self.lock:
+            entries = self.conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            return {
+                'entries': entries,
+                'bytes': self.total_bytes,
+                'hits': self.hits,
+                'revalidated': self.revalidated,
+                'misses': self.misses,
+            }
+
+    def lookup(self, url, params):
+        """Kunci cache, entry yang ada, dan apakah entry masih segar"""
+        key = normalize_url(url, params)
+        entry = self.get(key)
+        fresh = entry is not None and time.time() - entry.stored_at < self.ttl
+        return key, entry, fresh
+
+    def conditional_kwargs(self, entry, kwargs):
+        """Tambahkan header validasi ulang ke kwargs request"""
+        if entry is None:
+            return kwargs
+        validators = entry.validators()
+        if not validators:
+            return kwargs
+        headers = dict(kwargs.get('headers') or {})
+        headers.update(validators)
+        return dict(kwargs, headers=headers)
+
+    def fetch(self, send, url, params=None, **kwargs):
+        """
+        GET lewat cache untuk requests
+
+        Args:
+            send: Fungsi request, mis. session.get (boleh dibungkus rate limiter)
+            url, params, **kwargs: Sama seperti session.get
+
+        Returns:
+            requests.Response (dari cache atau dari server)
+        """
+        key, entry, fresh = self.lookup(url, params)
+        if fresh:
+            self.hits += 1
+            return self.build_response(entry)
+
+        response = send(url, params=params, **self.conditional_kwargs(entry, kwargs))
+
+        if response.status_code == 304 and entry is not None:
+            self.revalidated += 1
+            self.refresh(key, {name.lower(): value for name, value in response.headers.items()})
+            return self.build_response(entry)
+
+        self.misses += 1
+        if response.status_code == 200:
+            self.put(key, response.url, response.status_code, response.headers, response.content)
+        return response
+
+    async def fetch_async(self, send, url, params=None, **kwargs):
+        """Versi asyncio dari fetch() untuk httpx.AsyncClient"""
+        key, entry, fresh = self.lookup(url, params)
+        if fresh:
+            self.hits += 1
+            return self.build_httpx_response(entry)
+
+        response = await send(url, params=params, **self.conditional_kwargs(entry, kwargs))
+
+        if response.status_code == 304 and entry is not None:
+            self.revalidated += 1
+            self.refresh(key, {name.lower(): value for name, value in response.headers.items()})
+            return self.build_httpx_response(entry)
+
+        self.misses += 1
+        if response.status_code == 200:
+            self.put(key, str(response.url), response.status_code, response.headers, response.content)
+        return response
+
+    def build_response(self, entry):
+        """Bangun requests.Response dari entry cache"""
+        response = requests.Response()
+        response.status_code = entry.status
+        response.headers = CaseInsensitiveDict(entry.headers)
+        response._content = entry.body
+        response.url = entry.url
+        response.encoding = get_encoding_from_headers(response.headers)
+        return response
+
+    def build_httpx_response(self, entry):
+        """Bangun httpx.Response dari entry cache"""
+        import httpx
+
+        # Body sudah didekompresi saat disimpan
+        headers = {
+            name: value for name, value in entry.headers.items()
+            if name not in ('content-encoding', 'content-length', 'transfer-encoding')
+        }
+        return httpx.Response(
+            entry.status,
+            headers=headers,
+            content=entry.body,
+            request=httpx.Request('GET', entry.url)
+        )
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache():
+    """Cache bersama untuk semua scraper dalam satu proses"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = HttpCache()
+        return _default_cache
@@ -0,0 +1,102 @@
+"""
+HTTP Client Module
+Session requests dengan connection pool keep-alive dan statistik koneksi
+"""
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class PoolStats:
+    """Penghitung koneksi dan request yang aman untuk banyak thread"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.connections_opened = 0
+        self.requests = 0
+
+    def connection_opened(self):
+        with self.lock:
+            self.connections_opened += 1
+
+    def request_sent(self):
+        with self.lock:
+            self.requests += 1
+
+    def snapshot(self):
+        """Ringkasan statistik pool"""
+        with self.lock:
+            opened = self.connections_opened
+            total = self.requests
+        return {
+            'connections_opened': opened,
+            'connections_reused': max(0, total - opened),
+            'requests': total,
+            'requests_per_connection': round(total / opened, 2) if opened else 0.0,
+        }
+
+
+class PooledAdapter(HTTPAdapter):
+    """HTTPAdapter yang mencatat setiap koneksi baru dan setiap request"""
+
+    def __init__(self, stats, **kwargs):
+        self.stats = stats
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        stats = self.stats
+
+        # Subclass pool per adapter agar _new_conn bisa mencatat ke stats ini
+        class CountingHTTPConnectionPool(HTTPConnectionPool):
+            def _new_conn(self):
+                stats.connection_opened()
+                return super()._new_conn()
+
+        class CountingHTTPSConnectionPool(HTTPSConnectionPool):
+            def _new_conn(self):
+                stats.connection_opened()
+                return super()._new_conn()
+
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': CountingHTTPConnectionPool,
+            'https': CountingHTTPSConnectionPool,
+        }
+
+    def send(self, request, **kwargs):
+        self.stats.request_sent()
+        return super().send(request, **kwargs)
+
+
+def create_session(pool_size=10, pool_connections=10, headers=None):
+    """
+    Buat requests.Session dengan connection pool keep-alive
+
+    Args:
+        pool_size: Maksimal koneksi yang disimpan per host
+        pool_connections: Jumlah host yang pool-nya disimpan
+        headers: Header default untuk semua request
+
+    Returns:
+        requests.Session dengan atribut pool_stats (PoolStats)
+    """
+    session = requests.Session()
+    stats = PoolStats()
+    # pool_block=True: thread menunggu koneksi dari pool daripada membuka
+    # koneksi sekali pakai yang langsung dibuang
+    adapter = PooledAdapter(
+        stats,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_size,
+        pool_block=True
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({'Connection': 'keep-alive'})
+    if headers:
+        session.headers.update(headers)
+    session.pool_stats = stats
+    return session
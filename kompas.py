@@ -4,45 +4,253 @@ Library untuk scraping artikel dari Kompas.com
 """
 
 import requests
-from bs4 import BeautifulSoup
 import time
-import json
 import re
 import pandas as pd
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlsplit, urlunsplit, urlencode, parse_qsl
 import warnings
-import os
-from pathlib import Path
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from ratelimit import shared_limiter
+from http_client import create_session
+from http_cache import get_default_cache
+from checkpoint import CheckpointJournal
+from article_store import get_default_store
+from article import Article
+from selector_cache import SelectorCache, site_key
+from metadata import extract_head_metadata, parse_datetime
+from parse_pool import ParsePipeline
+import exporters
+from html_parser import class_pattern, default_backend
+from charset import UNRESOLVED, shared_encodings, soup_from_response
+from bs4 import NavigableString, SoupStrainer
 warnings.filterwarnings('ignore')
 
+# Halaman pencarian: hanya bangun subtree daftar artikel dan pagination
+SEARCH_PAGE_STRAINER = SoupStrainer(class_=class_pattern('articleItem', 'paging__wrap'))
+
+
+class ContentCleaner:
+    """
+    Pembersih konten artikel yang dikompilasi sekali: elemen non-konten
+    (iklan, rekomendasi, script, dll) dilewati dalam satu kali jalan di pohon
+    DOM, tanpa copy dan tanpa decompose, sekaligus mengumpulkan teks paragraf.
+    """
+
+    def __init__(self, remove_tags, remove_classes, class_patterns, id_patterns, skip_keywords):
+        """
+        Args:
+            remove_tags: Nama tag yang selalu dibuang (script, style, ...)
+            remove_classes: Dict nama_tag -> set class yang dibuang (mis. div.wSpec)
+            class_patterns: Potongan teks atribut class yang dibuang ([class*=...])
+            id_patterns: Potongan teks atribut id yang dibuang ([id*=...])
+            skip_keywords: Paragraf yang mengandung salah satu keyword ini dilewati
+        """
+        self.remove_tags = frozenset(remove_tags)
+        self.remove_classes = {tag: frozenset(classes) for tag, classes in remove_classes.items()}
+        self.class_pattern = re.compile('|'.join(map(re.escape, class_patterns)))
+        self.id_pattern = re.compile('|'.join(map(re.escape, id_patterns)))
+        self.skip_pattern = re.compile('|'.join(re.escape(keyword.lower()) for keyword in skip_keywords))
+
+    def is_removed(self, tag):
+        """Apakah elemen (beserta isinya) bukan konten"""
+        if tag.name in self.remove_tags:
+            return True
+
+        classes = tag.get('class')
+        if classes:
+            if isinstance(classes, str):
+                class_value, classes = classes, classes.split()
+            else:
+                class_value = ' '.join(classes)
+            if self.class_pattern.search(class_value):
+                return True
+            removed = self.remove_classes.get(tag.name)
+            if removed and not removed.isdisjoint(classes):
+                return True
+
+        element_id = tag.get('id')
+        return bool(element_id) and self.id_pattern.search(element_id) is not None
+
+    @staticmethod
+    def string_types(tag):
+        """Tipe NavigableString yang dihitung get_text() untuk tag ini"""
+        types = tag.interesting_string_types or tag.MAIN_CONTENT_STRING_TYPES
+        return (types,) if isinstance(types, type) else types
+
+    def walk(self, root):
+        """
+        Jalan sekali di bawah root, lewati subtree yang bukan konten
+
+        Returns:
+            (teks setiap <p> sesuai urutan dokumen seperti get_text(strip=True),
+             semua string konten untuk fallback get_text())
+        """
+        root_types = self.string_types(root)
+        paragraphs = []
+        strings = []
+        # Paragraf yang sedang terbuka (bisa bersarang): (potongan teks, tipe string)
+        open_paragraphs = []
+        stack = [(False, iter(root.contents))]
+
+        while stack:
+            is_paragraph, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                if is_paragraph:
+                    open_paragraphs.pop()
+                continue
+
+            if isinstance(child, NavigableString):
+                child_type = type(child)
+                if child_type in root_types:
+                    strings.append(child)
+                if open_paragraphs:
+                    stripped = child.strip()
+                    if stripped:
+                        for parts, types in open_paragraphs:
+                            if child_type in types:
+                                parts.append(stripped)
+                continue
+
+            if self.is_removed(child):
+                continue
+            if child.name == 'p':
+                parts = []
+                paragraphs.append(parts)
+                open_paragraphs.append((parts, self.string_types(child)))
+                stack.append((True, iter(child.contents)))
+            else:
+                stack.append((False, iter(child.contents)))
+
+        return [''.join(parts) for parts in paragraphs], strings
+
+    def filter_paragraphs(self, paragraphs, skip_read_also=False):
+        """Buang paragraf kosong, paragraf iklan, dan (opsional) 'Baca juga:' panjang"""
+        content_parts = []
+        for text in paragraphs:
+            if not text:
+                continue
+            lowered = text.lower()
+            if self.skip_pattern.search(lowered):
+                continue
+            if skip_read_also and lowered.startswith('baca juga:') and len(text) > 30:
+                continue
+            content_parts.append(text)
+        return content_parts
+
+
+CONTENT_CLEANER = ContentCleaner(
+    remove_tags=['script', 'style', 'iframe', 'noscript'],
+    remove_classes={
+        'div': ['ads-on-body', 'ads-partner-wrap', 'kompasidRec', 'read__credit',
+                'tagsCloud-tag', 'wSpec', 'native-wrap', 'fb-quote'],
+        'span': ['ads-on-body', 'liftdown_v2_tanda'],
+    },
+    class_patterns=['ads-', 'iklan', 'recommend', 'related', 'komentar', 'comment',
+                    'share', 'sidebar', 'video', 'DFP'],
+    id_patterns=['ads', 'iklan'],
+    skip_keywords=[
+        'berikan apresiasi',
+        'dalam segala situasi, kompas.com berkomitmen',
+        'kirimkan apresiasi spesial',
+    ],
+)
+
+
 class KompasScraper:
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'id-ID,id;q=0.9,en-US;q=0.8,en;q=0.7',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-        })
+    def __init__(self, max_workers=5, rate_limiter=None, pool_size=None, cache=True, parser_backend=None,
+                 parse_workers=None):
+        # Jumlah worker untuk pengambilan detail artikel secara paralel
+        self.max_workers = max(1, max_workers)
+        # Pool koneksi keep-alive harus cukup besar untuk semua worker
+        self.session = create_session(
+            pool_size=pool_size or max(10, self.max_workers),
+            headers={
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+                'Accept-Language': 'id-ID,id;q=0.9,en-US;q=0.8,en;q=0.7',
+                'Accept-Encoding': 'gzip, deflate, br',
+                'Connection': 'keep-alive',
+            }
+        )
+        # Batas laju per host, dipakai bersama semua scraper
+        self.rate_limiter = rate_limiter or shared_limiter
+        # Cache respons HTTP di disk (True = cache bersama, None/False = nonaktif)
+        self.cache = get_default_cache() if cache is True else (cache or None)
+        # Backend parser HTML: 'lxml' (default jika terpasang) atau 'html.parser'
+        self.parser_backend = parser_backend or default_backend()
+        # Encoding per host: body di-parse dari byte mentah tanpa deteksi ulang
+        self.encodings = shared_encodings
+        # Jumlah proses untuk tahap parsing (None/0 = parsing di thread fetch)
+        self.parse_workers = parse_workers
+        # Selector yang berhasil per situs dicoba lebih dulu di halaman berikutnya
+        self.selector_cache = SelectorCache()
         self.base_search_url = "https://search.kompas.com/search"
     
+    def fetch(self, url, **kwargs):
+        """Kirim GET lewat cache HTTP, lalu session dan rate limiter per host"""
+        def send(url, **kwargs):
+            return self.rate_limiter.request(self.session.get, url, **kwargs)
+        
+        if self.cache:
+            return self.cache.fetch(send, url, **kwargs)
+        return send(url, **kwargs)
+    
+    def pool_stats(self):
+        """Statistik connection pool: koneksi dibuka, dipakai ulang, request per koneksi"""
+        return self.session.pool_stats.snapshot()
+    
+    def selector_stats(self):
+        """Statistik hit/miss selector per extractor"""
+        return self.selector_cache.stats()
+    
     def get_total_search_pages(self, keyword):
         """Mendapatkan total halaman pencarian tanpa mengambil artikel"""
         try:
-            params = {'q': keyword, 'page': 1}
-            response = self.session.get(self.base_search_url, params=params, timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = self.fetch_search_page(keyword, 1)
             total_pages = self.get_total_pages(soup)
             return total_pages if total_pages else 1
         except Exception as e:
             print(f"Error mendapatkan total halaman: {e}")
             return 1
         
-    def search_articles(self, keyword, max_pages=None):
-        """Mencari artikel berdasarkan keyword dengan pagination yang benar"""
+    def fetch_search_page(self, keyword, page):
+        """Ambil dan parse satu halaman hasil pencarian"""
+        params = {
+            'q': keyword,
+            'page': page
+        }
+        response = self.fetch(self.base_search_url, params=params, timeout=30)
+        response.raise_for_status()
+        return self.search_soup(response)
+    
+    def parse_search_page(self, soup):
+        """Ekstrak semua artikel dari satu halaman pencarian (None jika kosong)"""
+        article_items = soup.find_all('div', class_='articleItem')
+        if not article_items:
+            return None
+        
+        articles = []
+        for item in article_items:
+            article_data = self.extract_search_result(item)
+            if article_data:
+                articles.append(article_data)
+        return articles
+    
+    def search_articles(self, keyword, max_pages=None, parallel=False):
+        """
+        Mencari artikel berdasarkan keyword dengan pagination yang benar
+        
+        Args:
+            keyword: Kata kunci pencarian
+            max_pages: Maksimal halaman pencarian (default: None = semua)
+            parallel: Ambil halaman 2..N secara paralel setelah total halaman diketahui
+        """
+        if parallel:
+            return self.search_articles_parallel(keyword, max_pages=max_pages)
+        
         articles = []
         page = 1
         total_pages = None
@@ -53,32 +261,20 @@ class KompasScraper:
             # Cek jika sudah mencapai batas halaman yang diinginkan
             if max_pages and page > max_pages:
                 break
-                
-            params = {
-                'q': keyword,
-                'page': page
-            }
             
             try:
                 print(f"Mengambil halaman {page}...")
-                response = self.session.get(self.base_search_url, params=params, timeout=30)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = self.fetch_search_page(keyword, page)
                 
                 # Cari semua artikel
-                article_items = soup.find_all('div', class_='articleItem')
+                page_articles = self.parse_search_page(soup)
                 
-                if not article_items:
+                if page_articles is None:
                     print("Tidak ditemukan artikel di halaman ini")
                     break
                 
-                print(f"Ditemukan {len(article_items)} artikel di halaman {page}")
-                
-                for item in article_items:
-                    article_data = self.extract_search_result(item)
-                    if article_data:
-                        articles.append(article_data)
+                print(f"Ditemukan {len(page_articles)} artikel di halaman {page}")
+                articles.extend(page_articles)
                 
                 # Cek total halaman dari pagination
                 if total_pages is None:
@@ -90,7 +286,6 @@ class KompasScraper:
                     break
                     
                 page += 1
-                time.sleep(1.5)  # Delay untuk menghindari blocking
                 
             except requests.exceptions.RequestException as e:
                 print(f"Error saat mengambil halaman {page}: {e}")
@@ -101,6 +296,61 @@ class KompasScraper:
         
         return articles, total_pages
     
+    def search_articles_parallel(self, keyword, max_pages=None):
+        """Ambil halaman 1, lalu halaman 2..N secara paralel dalam batas rate limiter host"""
+        print(f"[SEARCHING] Memulai pencarian paralel untuk keyword: {keyword}")
+        
+        try:
+            print("Mengambil halaman 1...")
+            first_soup = self.fetch_search_page(keyword, 1)
+        except Exception as e:
+            print(f"Error saat mengambil halaman 1: {e}")
+            return [], None
+        
+        total_pages = self.get_total_pages(first_soup)
+        last_page = min(total_pages, max_pages) if max_pages else total_pages
+        
+        pages = [self.parse_search_page(first_soup)]
+        pages.extend(self.fetch_search_pages(keyword, range(2, last_page + 1)))
+        
+        return self.merge_search_pages(pages), total_pages
+    
+    def fetch_search_pages(self, keyword, pages):
+        """
+        Ambil dan parse beberapa halaman pencarian secara paralel
+        
+        Returns:
+            Hasil parse_search_page per halaman sesuai urutan pages (None jika kosong/gagal)
+        """
+        pages = list(pages)
+        if not pages:
+            return []
+        
+        def fetch(page):
+            try:
+                return self.parse_search_page(self.fetch_search_page(keyword, page))
+            except Exception as e:
+                print(f"Error saat mengambil halaman {page}: {e}")
+                return None
+        
+        print(f"Mengambil {len(pages)} halaman pencarian secara paralel...")
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pages))) as executor:
+            return list(executor.map(fetch, pages))
+    
+    def merge_search_pages(self, pages):
+        """
+        Gabungkan hasil per halaman sesuai urutan halaman, berhenti di halaman
+        kosong/gagal (None) seperti pada mode berurutan
+        """
+        articles = []
+        for page, page_articles in enumerate(pages, 1):
+            if page_articles is None:
+                print(f"Tidak ditemukan artikel di halaman {page}")
+                break
+            print(f"Ditemukan {len(page_articles)} artikel di halaman {page}")
+            articles.extend(page_articles)
+        return articles
+    
     def get_total_pages(self, soup):
         """Mendapatkan total halaman dari pagination"""
         try:
@@ -164,72 +414,42 @@ class KompasScraper:
             summary_tag = article_item.find('div', class_='articleLead')
             summary = summary_tag.get_text(strip=True) if summary_tag else ""
             
-            return {
-                'title': title,
-                'url': article_url,
-                'image_url': image_url,
-                'date': date,
-                'category': category,
-                'summary': summary
-            }
+            return Article(
+                title=title,
+                url=article_url,
+                image_url=image_url,
+                date=date,
+                category=category,
+                summary=summary
+            )
             
         except Exception as e:
             print(f"Error ekstrak hasil: {e}")
             return None
     
-    def get_article_detail(self, url):
-        """Ambil detail lengkap artikel"""
+    def get_article_detail(self, url, metadata_only=False):
+        """Ambil detail lengkap artikel (atau hanya metadata <head> jika metadata_only)"""
+        response = self.download_article(url)
+        if response is None:
+            return None
+        
+        try:
+            return self.parse_response(response, url, metadata_only)
+        except Exception as e:
+            print(f"   Error lain saat mengambil detail: {e}")
+            return None
+    
+    def download_article(self, url):
+        """Unduh halaman artikel dengan retry (tahap I/O, tanpa parsing); None jika gagal"""
         max_retries = 3
         retry_count = 0
         
         while retry_count < max_retries:
             try:
                 print(f"   Mengambil detail: {url}")
-                response = self.session.get(url, timeout=30)
+                response = self.fetch(self.article_url(url), timeout=30)
                 response.raise_for_status()
-                
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Judul artikel
-                title = self.extract_title(soup)
-                
-                # Penulis
-                author = self.extract_author(soup)
-                
-                # Editor
-                editor = self.extract_editor(soup)
-                
-                # Tanggal publish
-                date_published = self.extract_date(soup, url)
-                
-                # Breadcrumb untuk kategori
-                categories = self.extract_categories(soup)
-                
-                # Konten artikel
-                content = self.extract_content(soup)
-                
-                # Tags
-                tags = self.extract_tags(soup)
-                
-                # Halaman (untuk multi-page articles)
-                pages = self.extract_pages(soup, url)
-                
-                article_data = {
-                    'title': title,
-                    'author': author,
-                    'editor': editor,
-                    'date_published': date_published,
-                    'categories': ', '.join(categories),
-                    'content': content,
-                    'tags': ', '.join(tags),
-                    'url': url,
-                    'total_pages': len(pages)
-                }
-                
-                # Karena sudah pakai ?page=all, tidak perlu ambil halaman tambahan
-                article_data['multi_page'] = False
-                
-                return article_data
+                return response
                 
             except requests.exceptions.Timeout as e:
                 retry_count += 1
@@ -259,7 +479,134 @@ class KompasScraper:
                 print(f"   Error lain saat mengambil detail: {e}")
                 return None
     
-    def extract_title(self, soup):
+    def article_url(self, url):
+        """URL artikel dengan ?page=all: artikel multi-halaman terambil utuh dalam satu request"""
+        parts = urlsplit(url)
+        query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True) if key != 'page']
+        query.append(('page', 'all'))
+        return urlunsplit(parts._replace(query=urlencode(query)))
+    
+    def complete_article(self, article):
+        """Artikel sudah utuh karena diambil dengan ?page=all"""
+        return article
+    
+    def response_soup(self, response, encoding=UNRESOLVED):
+        """Parse byte mentah respons (requests/httpx) menjadi BeautifulSoup"""
+        return soup_from_response(response, self.parser_backend, encodings=self.encodings,
+                                  encoding=encoding)
+    
+    def response_metadata(self, response, encoding=UNRESOLVED):
+        """Metadata artikel dari <head> respons, tanpa membangun DOM body"""
+        if encoding is UNRESOLVED:
+            encoding = self.encodings.encoding_for(response)
+        return extract_head_metadata(response.content, self.parser_backend, from_encoding=encoding)
+    
+    def search_soup(self, response):
+        """Parse halaman pencarian secara parsial (hanya daftar artikel dan pagination)"""
+        return soup_from_response(response, self.parser_backend, parse_only=SEARCH_PAGE_STRAINER,
+                             encodings=self.encodings)
+    
+    def parse_response(self, response, url, metadata_only=False):
+        """
+        Parse respons halaman artikel: metadata dari <head> lebih dulu, DOM lengkap
+        hanya dibangun untuk field yang tidak tersedia di sana (konten, dll)
+        """
+        # Encoding dicari sekali, dipakai untuk parse <head> dan DOM
+        encoding = self.encodings.encoding_for(response)
+        metadata = self.metadata_fields(self.response_metadata(response, encoding), url)
+        if metadata_only:
+            return self.metadata_record(metadata, url)
+        return self.parse_article(self.response_soup(response, encoding), url, metadata)
+    
+    def metadata_fields(self, metadata, url):
+        """Petakan metadata <head> ke field artikel Kompas (format sama dengan extractor)"""
+        fields = {}
+        if metadata.get('title'):
+            fields['title'] = metadata['title']
+        if metadata.get('author'):
+            fields['author'] = ', '.join(metadata['author'])
+        
+        date_published = self.date_from_url(url)
+        if not date_published:
+            published = parse_datetime(metadata.get('date_published'))
+            if published:
+                date_published = published.strftime('%d-%m-%Y')
+        if date_published:
+            fields['date_published'] = date_published
+        
+        if metadata.get('section'):
+            fields['categories'] = metadata['section']
+        if metadata.get('keywords'):
+            fields['tags'] = ', '.join(dict.fromkeys(metadata['keywords']))
+        return fields
+    
+    def metadata_record(self, fields, url):
+        """Record artikel dari metadata saja (tanpa konten), kolom sama dengan parse_article"""
+        article_data = Article(
+            title='',
+            author='',
+            editor='',
+            date_published='',
+            categories='',
+            content='',
+            tags='',
+            url=url,
+            total_pages=1,
+            multi_page=False
+        )
+        article_data.update(fields)
+        return article_data
+    
+    def parse_article(self, soup, url, metadata=None):
+        """
+        Ekstrak semua field artikel dari halaman detail yang sudah di-parse.
+        Judul, penulis dan tanggal dari `metadata` (lihat metadata_fields) dipakai
+        jika ada, sehingga extractor DOM hanya jalan untuk yang kosong.
+        """
+        metadata = metadata or {}
+        
+        # Judul artikel
+        title = metadata.get('title') or self.extract_title(soup, url)
+        
+        # Penulis
+        author = metadata.get('author') or self.extract_author(soup, url)
+        
+        # Editor
+        editor = self.extract_editor(soup)
+        
+        # Tanggal publish
+        date_published = metadata.get('date_published') or self.extract_date(soup, url)
+        
+        # Breadcrumb untuk kategori
+        categories = self.extract_categories(soup)
+        
+        # Konten artikel
+        content = self.extract_content(soup, url)
+        
+        # Tags
+        tags = self.extract_tags(soup)
+        
+        # Halaman (untuk multi-page articles)
+        pages = self.extract_pages(soup, url)
+        
+        article_data = Article(
+            title=title,
+            author=author,
+            editor=editor,
+            date_published=date_published,
+            categories=', '.join(categories),
+            content=content,
+            tags=', '.join(tags),
+            url=url,
+            total_pages=len(pages)
+        )
+        
+        # Karena sudah pakai ?page=all, tidak perlu ambil halaman tambahan
+        article_data['multi_page'] = False
+        
+        return article_data
+    
+    def extract_title(self, soup, url=""):
         """Ekstrak judul artikel"""
         # Coba beberapa kemungkinan class untuk judul
         title_selectors = [
@@ -270,10 +617,9 @@ class KompasScraper:
             'h1'
         ]
         
-        for selector in title_selectors:
-            title_tag = soup.select_one(selector)
-            if title_tag:
-                return title_tag.get_text(strip=True)
+        title_tag = self.selector_cache.first_match(soup, 'title', title_selectors, site_key(url))
+        if title_tag:
+            return title_tag.get_text(strip=True)
         
         # Coba dari meta tag
         meta_title = soup.find('meta', property='og:title')
@@ -282,7 +628,7 @@ class KompasScraper:
         
         return ""
     
-    def extract_author(self, soup):
+    def extract_author(self, soup, url=""):
         """Ekstrak penulis artikel"""
         # Coba beberapa selector untuk penulis
         author_selectors = [
@@ -296,19 +642,18 @@ class KompasScraper:
             'meta[property="article:author"]'
         ]
         
-        for selector in author_selectors:
+        def author_text(selector, element):
             if selector.startswith('meta'):
-                meta = soup.select_one(selector)
-                if meta and meta.get('content'):
-                    return meta['content']
-            else:
-                element = soup.select_one(selector)
-                if element:
-                    text = element.get_text(strip=True)
-                    if text and len(text) > 2:
-                        return text
+                return element.get('content')
+            text = element.get_text(strip=True)
+            if text and len(text) > 2:
+                return text
+            return None
         
-        return ""
+        author = self.selector_cache.first_match(
+            soup, 'author', author_selectors, site_key(url), extract=author_text
+        )
+        return author or ""
     
     def extract_editor(self, soup):
         """Ekstrak editor"""
@@ -326,9 +671,9 @@ class KompasScraper:
     def extract_date(self, soup, url=""):
         """Ekstrak tanggal publish"""
         # Coba dari URL (format: /read/YYYY/MM/DD/)
-        date_match = re.search(r'/(\d{4})/(\d{2})/(\d{2})/', url)
-        if date_match:
-            return f"{date_match.group(3)}-{date_match.group(2)}-{date_match.group(1)}"
+        date_published = self.date_from_url(url)
+        if date_published:
+            return date_published
         
         # Coba dari meta tag
         meta_selectors = [
@@ -337,15 +682,21 @@ class KompasScraper:
             'meta[name="date"]'
         ]
         
-        for selector in meta_selectors:
-            meta = soup.select_one(selector)
-            if meta and meta.get('content'):
-                date_str = meta['content']
-                # Ekstrak hanya tanggal (YYYY-MM-DD)
-                date_match = re.search(r'(\d{4}-\d{2}-\d{2})', date_str)
-                if date_match:
-                    return date_match.group(1)
+        def meta_date(selector, meta):
+            # Ekstrak hanya tanggal (YYYY-MM-DD)
+            date_match = re.search(r'(\d{4}-\d{2}-\d{2})', meta.get('content') or '')
+            return date_match.group(1) if date_match else None
         
+        date = self.selector_cache.first_match(
+            soup, 'date', meta_selectors, site_key(url), extract=meta_date
+        )
+        return date or ""
+    
+    def date_from_url(self, url):
+        """Tanggal DD-MM-YYYY dari URL artikel (format: /read/YYYY/MM/DD/)"""
+        date_match = re.search(r'/(\d{4})/(\d{2})/(\d{2})/', url)
+        if date_match:
+            return f"{date_match.group(3)}-{date_match.group(2)}-{date_match.group(1)}"
         return ""
     
     def extract_categories(self, soup):
@@ -365,7 +716,7 @@ class KompasScraper:
         
         return categories
     
-    def extract_content(self, soup):
+    def extract_content(self, soup, url=""):
         """Ekstrak konten artikel lengkap - SEMUA paragraf tanpa filter yang ketat"""
         # Coba beberapa selector untuk konten
         content_selectors = [
@@ -376,75 +727,18 @@ class KompasScraper:
             'article'
         ]
         
-        content_div = None
-        for selector in content_selectors:
-            content_div = soup.select_one(selector)
-            if content_div:
-                break
-        
+        content_div = self.selector_cache.first_match(soup, 'content', content_selectors, site_key(url))
         if not content_div:
             return ""
         
-        # Clone untuk menghindari modifikasi original
-        import copy
-        content_div_copy = copy.copy(content_div)
-        
-        # Hapus elemen yang PASTI bukan konten
-        remove_selectors = [
-            'script', 'style', 'iframe', 'noscript',
-            'div.ads-on-body', 'div.ads-partner-wrap', 'div.kompasidRec',
-            '[class*="ads-"]', '[class*="iklan"]', '[class*="recommend"]',
-            '[class*="related"]', '[class*="komentar"]', '[class*="comment"]',
-            '[class*="share"]', '[class*="sidebar"]', '[class*="video"]',
-            'div.read__credit', 'div.tagsCloud-tag', 'div.wSpec', 'div.native-wrap',
-            'div.fb-quote', '[id*="ads"]', '[id*="iklan"]',
-            'span.ads-on-body', '[class*="DFP"]', 'span.liftdown_v2_tanda'
-        ]
-        
-        for selector in remove_selectors:
-            try:
-                for element in content_div_copy.select(selector):
-                    element.decompose()
-            except:
-                pass
-        
-        # Ambil SEMUA paragraf tanpa batasan
-        paragraphs = content_div_copy.find_all('p', recursive=True)
-        content_parts = []
-        
-        for p in paragraphs:
-            text = p.get_text(strip=True)
-            
-            # Hanya skip paragraf yang jelas iklan atau non-konten
-            skip_keywords = [
-                'berikan apresiasi',
-                'dalam segala situasi, kompas.com berkomitmen',
-                'kirimkan apresiasi spesial',
-            ]
-            
-            # Ambil jika ada teks dan bukan keyword skip
-            if text and len(text) > 0:
-                should_skip = False
-                for keyword in skip_keywords:
-                    if keyword.lower() in text.lower():
-                        should_skip = True
-                        break
-                
-                # Jika paragraf dimulai dengan "Baca juga:" tapi ada lebih dari 30 karakter, ambil saja
-                if text.lower().startswith('baca juga:') and len(text) > 30:
-                    should_skip = True
-                
-                if not should_skip:
-                    content_parts.append(text)
+        # Satu kali jalan di pohon: elemen non-konten dilewati, soup tidak diubah
+        paragraphs, strings = CONTENT_CLEANER.walk(content_div)
+        content_parts = CONTENT_CLEANER.filter_paragraphs(paragraphs, skip_read_also=True)
         
         # Jika masih kosong, coba ambil dengan cara lain
         if not content_parts:
-            try:
-                all_text = content_div_copy.get_text(separator='\n')
-                lines = [line.strip() for line in all_text.split('\n') if line.strip() and len(line.strip()) > 10]
-                content_parts = lines
-            except:
-                pass
+            all_text = '\n'.join(strings)
+            content_parts = [line.strip() for line in all_text.split('\n') if len(line.strip()) > 10]
         
         # Gabungkan semua paragraf
         if content_parts:
@@ -474,7 +768,7 @@ class KompasScraper:
             keywords = meta_keywords['content'].split(',')
             tags.extend([k.strip() for k in keywords if k.strip()])
         
-        return list(set(tags))  # Hapus duplikat
+        return list(dict.fromkeys(tags))  # Hapus duplikat, urutan tetap
     
     def extract_pages(self, soup, base_url):
         """Ekstrak link ke halaman lain - gunakan ?page=all untuk semuanya"""
@@ -485,59 +779,15 @@ class KompasScraper:
     def get_page_content(self, url):
         """Ambil konten lengkap dari halaman tertentu - SEMUA paragraf"""
         try:
-            response = self.session.get(url, timeout=30)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            response = self.fetch(url, timeout=30)
+            soup = self.response_soup(response)
             
             content_div = soup.find('div', class_='read__content')
             if not content_div:
                 return ""
             
-            # Clone untuk menghindari modifikasi original
-            import copy
-            content_div_copy = copy.copy(content_div)
-            
-            # Hapus elemen yang PASTI bukan konten
-            remove_selectors = [
-                'script', 'style', 'iframe', 'noscript',
-                'div.ads-on-body', 'div.ads-partner-wrap', 'div.kompasidRec',
-                '[class*="ads-"]', '[class*="iklan"]', '[class*="recommend"]',
-                '[class*="related"]', '[class*="komentar"]', '[class*="comment"]',
-                '[class*="share"]', '[class*="sidebar"]', '[class*="video"]',
-                'div.read__credit', 'div.tagsCloud-tag', 'div.wSpec', 'div.native-wrap',
-                'div.fb-quote', '[id*="ads"]', '[id*="iklan"]',
-                'span.ads-on-body', '[class*="DFP"]', 'span.liftdown_v2_tanda'
-            ]
-            
-            for selector in remove_selectors:
-                try:
-                    for element in content_div_copy.select(selector):
-                        element.decompose()
-                except:
-                    pass
-            
-            # Ambil SEMUA paragraf
-            paragraphs = content_div_copy.find_all('p', recursive=True)
-            content_parts = []
-            
-            for p in paragraphs:
-                text = p.get_text(strip=True)
-                
-                # Hanya skip paragraf yang jelas iklan
-                skip_keywords = [
-                    'berikan apresiasi',
-                    'dalam segala situasi, kompas.com berkomitmen',
-                    'kirimkan apresiasi spesial',
-                ]
-                
-                if text and len(text) > 0:
-                    should_skip = False
-                    for keyword in skip_keywords:
-                        if keyword.lower() in text.lower():
-                            should_skip = True
-                            break
-                    
-                    if not should_skip:
-                        content_parts.append(text)
+            paragraphs, _ = CONTENT_CLEANER.walk(content_div)
+            content_parts = CONTENT_CLEANER.filter_paragraphs(paragraphs)
             
             return "\n\n".join(content_parts)
             
@@ -545,17 +795,101 @@ class KompasScraper:
             print(f"   Error mengambil halaman: {e}")
             return ""
     
-    def scrape_by_keyword(self, keyword, max_search_pages=None, max_articles=None):
+    def get_article_details(self, urls, max_workers=None, metadata_only=False):
+        """
+        Ambil detail banyak artikel secara paralel
+        
+        Args:
+            urls: List URL artikel
+            max_workers: Jumlah worker paralel (default: None = self.max_workers)
+            metadata_only: Hanya metadata dari <head>, tanpa isi artikel
+            
+        Returns:
+            List detail artikel sesuai urutan urls (None untuk yang gagal)
+        """
+        return list(self.iter_article_details(urls, max_workers=max_workers, metadata_only=metadata_only))
+    
+    def iter_article_details(self, urls, max_workers=None, window=None, metadata_only=False):
+        """
+        Seperti get_article_details, tetapi hasil di-yield satu per satu sesuai urutan urls.
+        Maksimal `window` request berjalan/menunggu sekaligus (default: 2x jumlah worker),
+        sehingga memori tidak bertambah sesuai jumlah artikel.
+        """
+        workers = max(1, max_workers or self.max_workers)
+        if self.parse_workers and len(urls) > 1:
+            # Unduh di thread, parse di proses terpisah (antrian terbatas `window`)
+            pipeline = ParsePipeline(self, io_workers=workers, parse_workers=self.parse_workers, queue_size=window)
+            yield from pipeline.iter_article_details(urls, metadata_only)
+            return
+        
+        if workers == 1 or len(urls) <= 1:
+            for url in urls:
+                yield self.get_article_detail(url, metadata_only)
+            return
+        
+        window = max(workers, window or workers * 2)
+        with ThreadPoolExecutor(max_workers=min(workers, len(urls))) as executor:
+            in_flight = deque()
+            for url in urls:
+                in_flight.append(executor.submit(self.get_article_detail, url, metadata_only))
+                if len(in_flight) >= window:
+                    yield in_flight.popleft().result()
+            while in_flight:
+                yield in_flight.popleft().result()
+    
+    def mark_failed(self, article):
+        """Isi data dasar untuk artikel yang gagal diambil detailnya"""
+        article['content'] = "Gagal mengambil konten"
+        article['author'] = ""
+        article['date_published'] = article['date']
+        article['categories'] = article['category']
+        article['tags'] = ""
+        article['total_pages'] = 1
+        article['multi_page'] = False
+        return article
+    
+    def scrape_by_keyword(self, keyword, max_search_pages=None, max_articles=None, max_workers=None,
+                          checkpoint=None, resume=False, seen_index=None, reuse_seen=True, store=None):
+        """
+        Scraping lengkap berdasarkan keyword (lihat iter_scrape_by_keyword untuk argumen)
+        
+        Returns:
+            List of article data
+        """
+        return list(self.iter_scrape_by_keyword(
+            keyword,
+            max_search_pages=max_search_pages,
+            max_articles=max_articles,
+            max_workers=max_workers,
+            checkpoint=checkpoint,
+            resume=resume,
+            seen_index=seen_index,
+            reuse_seen=reuse_seen,
+            store=store
+        ))
+    
+    def iter_scrape_by_keyword(self, keyword, max_search_pages=None, max_articles=None, max_workers=None,
+                               checkpoint=None, resume=False, seen_index=None, reuse_seen=True, window=None,
+                               store=None):
         """
-        Scraping lengkap berdasarkan keyword
+        Scraping lengkap berdasarkan keyword, setiap artikel di-yield begitu selesai
+        (urutan tetap sesuai hasil pencarian)
         
         Args:
             keyword: Kata kunci pencarian
             max_search_pages: Maksimal halaman pencarian (default: None = semua)
             max_articles: Maksimal artikel yang diambil (default: None = semua)
+            max_workers: Jumlah worker paralel untuk detail artikel (default: None = self.max_workers)
+            checkpoint: Path jurnal checkpoint atau CheckpointJournal (default: None = tanpa checkpoint)
+            resume: Lewati artikel yang sudah tercatat selesai di checkpoint
+            seen_index: SeenUrlIndex lintas run (default: None = tidak dicek)
+            reuse_seen: True = pakai record tersimpan untuk URL yang sudah pernah di-scrape,
+                False = buang URL tersebut dari hasil (hanya artikel baru)
+            window: Maksimal detail artikel yang diproses sekaligus (default: 2x jumlah worker)
+            store: ArticleStore untuk arsip full-text (default: None = tidak disimpan)
             
-        Returns:
-            List of article data
+        Yields:
+            Data artikel satu per satu
         """
         print(f"\n{'='*60}")
         print(f"MEMULAI SCRAPING KOMPAS")
@@ -563,11 +897,11 @@ class KompasScraper:
         print(f"{'='*60}")
         
         # Cari artikel
-        articles, total_pages = self.search_articles(keyword, max_pages=max_search_pages)
+        articles, total_pages = self.search_articles(keyword, max_pages=max_search_pages, parallel=True)
         
         if not articles:
             print("Tidak ada artikel yang ditemukan!")
-            return []
+            return
         
         print(f"\nHASIL PENCARIAN:")
         print(f"   Total artikel ditemukan: {len(articles)}")
@@ -580,125 +914,184 @@ class KompasScraper:
         # Batasi jumlah artikel
         articles = articles[:max_articles]
         
-        print(f"\nMENGAMBIL DETAIL {len(articles)} ARTIKEL...")
+        # Checkpoint: muat artikel yang sudah selesai atau mulai jurnal baru
+        journal = None
+        done = {}
+        if checkpoint:
+            journal = checkpoint if isinstance(checkpoint, CheckpointJournal) else CheckpointJournal(checkpoint)
+            if resume:
+                done = journal.load()
+            else:
+                journal.reset()
+        
+        # Indeks lintas run: cek sebelum mengambil detail artikel apa pun
+        if seen_index is not None:
+            seen = seen_index.get_many([article['url'] for article in articles])
+            if seen:
+                print(f"\nSUDAH PERNAH DI-SCRAPE: {len(seen)} artikel")
+                if reuse_seen:
+                    for url, record in seen.items():
+                        done.setdefault(url, record)
+                else:
+                    articles = [article for article in articles if article['url'] not in seen]
+        
+        pending_urls = [article['url'] for article in articles if article['url'] not in done]
+        if len(pending_urls) < len(articles):
+            print(f"\nMELANJUTKAN: {len(articles) - len(pending_urls)} artikel sudah selesai")
+        
+        print(f"\nMENGAMBIL DETAIL {len(pending_urls)} ARTIKEL...")
         print(f"{'='*60}")
         
-        results = []
         success_count = 0
+        total = len(articles)
+        
+        # Ambil detail secara paralel, hasil tetap sesuai urutan pencarian
+        details = self.iter_article_details(pending_urls, max_workers=max_workers, window=window)
         
-        for i, article in enumerate(articles, 1):
-            print(f"\n[{i}/{len(articles)}] Memproses: {article['title'][:60]}...")
+        # Artikel dikeluarkan dari antrian setelah di-yield, sehingga memori tidak
+        # menyimpan konten artikel yang sudah diserahkan ke pemanggil
+        queue = deque(articles)
+        del articles
+        
+        for i in range(1, total + 1):
+            article = queue.popleft()
+            print(f"\n[{i}/{total}] Memproses: {article['title'][:60]}...")
+            
+            if article['url'] in done:
+                success_count += 1
+                print(f"   Diambil dari data tersimpan")
+                yield done[article['url']]
+                continue
             
-            # Ambil detail lengkap
-            detail = self.get_article_detail(article['url'])
+            detail = next(details)
             
             if detail:
                 # Gabungkan dengan data pencarian
                 article.update(detail)
-                results.append(article)
                 success_count += 1
                 print(f"   Berhasil diambil ({len(detail['content'])} karakter)")
+                if journal:
+                    journal.record(article)
+                if seen_index is not None:
+                    seen_index.add(article, source='Kompas')
+                if store is not None:
+                    store.add(article, source='Kompas')
+                yield article
             else:
                 # Simpan data dasar saja
-                article['content'] = "Gagal mengambil konten"
-                article['author'] = ""
-                article['date_published'] = article['date']
-                article['categories'] = article['category']
-                article['tags'] = ""
-                article['total_pages'] = 1
-                article['multi_page'] = False
-                results.append(article)
                 print(f"   Gagal mengambil detail, menyimpan data dasar")
-            
-            # Delay untuk menghindari blocking
-            if i < len(articles):
-                time.sleep(2)
+                yield self.mark_failed(article)
+        
+        if store is not None:
+            store.flush()
         
         print(f"\n{'='*60}")
         print(f"SCRAPING SELESAI!")
-        print(f"Hasil: {success_count}/{len(articles)} artikel berhasil diambil detailnya")
+        print(f"Hasil: {success_count}/{total} artikel berhasil diambil detailnya")
         print(f"{'='*60}")
-        
-        return results
     
+    EXCEL_HEADERS = ['No', 'Judul', 'Tanggal', 'Penulis', 'Editor', 'Kategori', 'Tags', 'Ringkasan',
+                     'Konten', 'URL', 'Gambar', 'Jumlah Halaman', 'Multi Halaman']
+
+    def excel_rows(self, data):
+        """Baris Excel (urutan EXCEL_HEADERS) untuk setiap artikel"""
+        for number, article in enumerate(data, 1):
+            yield [
+                number,
+                article.get('title', ''),
+                article.get('date_published', article.get('date', '')),
+                article.get('author', ''),
+                article.get('editor', ''),
+                article.get('categories', article.get('category', '')),
+                article.get('tags', ''),
+                article.get('summary', ''),
+                article.get('content', ''),
+                article.get('url', ''),
+                article.get('image_url', ''),
+                article.get('total_pages', 1),
+                'Ya' if article.get('multi_page', False) else 'Tidak',
+            ]
+
     def save_to_excel(self, data, filename):
-        """Simpan hasil ke file Excel"""
+        """Simpan hasil ke file Excel (streaming, write-only; path atau stream biner)"""
         if not data:
             print("Tidak ada data untuk disimpan!")
             return
         
-        # Buat direktori jika belum ada
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
-        
-        # Siapkan data untuk DataFrame
-        excel_data = []
-        for article in data:
-            row = {
-                'No': len(excel_data) + 1,
-                'Judul': article.get('title', ''),
-                'Tanggal': article.get('date_published', article.get('date', '')),
-                'Penulis': article.get('author', ''),
-                'Editor': article.get('editor', ''),
-                'Kategori': article.get('categories', article.get('category', '')),
-                'Tags': article.get('tags', ''),
-                'Ringkasan': article.get('summary', ''),
-                'Konten': article.get('content', ''),
-                'URL': article.get('url', ''),
-                'Gambar': article.get('image_url', ''),
-                'Jumlah Halaman': article.get('total_pages', 1),
-                'Multi Halaman': 'Ya' if article.get('multi_page', False) else 'Tidak'
-            }
-            excel_data.append(row)
-        
-        # Buat DataFrame
-        df = pd.DataFrame(excel_data)
-        
         # Simpan ke Excel
         try:
-            # Gunakan xlsxwriter untuk format yang lebih baik
-            with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name='Kompas Artikel', index=False)
-                
-                # Auto-adjust column widths
-                worksheet = writer.sheets['Kompas Artikel']
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    adjusted_width = min(max_length + 2, 50)
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
+            count = exporters.save_to_excel(self.excel_rows(data), filename, self.EXCEL_HEADERS,
+                                            sheet_name='Kompas Artikel')
             
-            print(f"Data disimpan ke Excel: {filename}")
-            print(f"   Total baris: {len(df)}")
-            print(f"   Total kolom: {len(df.columns)}")
+            print(f"Data disimpan ke Excel: {exporters.target_name(filename)}")
+            print(f"   Total baris: {count}")
+            print(f"   Total kolom: {len(self.EXCEL_HEADERS)}")
             
         except Exception as e:
             print(f"Error menyimpan ke Excel: {e}")
+            if exporters.is_stream(filename):
+                raise
             # Fallback ke CSV
             csv_file = filename.replace('.xlsx', '.csv')
+            df = pd.DataFrame(self.excel_rows(data), columns=self.EXCEL_HEADERS)
             df.to_csv(csv_file, index=False, encoding='utf-8-sig')
             print(f"Data disimpan ke CSV: {csv_file}")
     
     def save_to_json(self, data, filename):
-        """Simpan hasil ke file JSON"""
-        # Buat direktori jika belum ada
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        """
+        Simpan hasil ke file JSON (satu array, ditulis per artikel)
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        print(f"Data disimpan ke JSON: {filename}")
+        Args:
+            data: List atau generator artikel (mis. iter_scrape_by_keyword)
+            filename: Nama file (.json) atau stream biner
+        """
+        # Direktori dibuat jika belum ada
+        count = exporters.save_to_json(data, filename)
+        print(f"Data disimpan ke JSON: {exporters.target_name(filename)} ({count} artikel)")
+        return count
     
-    def save_to_txt(self, data, filename):
-        """Simpan hasil ke file teks"""
-        # Buat direktori jika belum ada
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
+    def save_to_jsonl(self, data, filename, compression=None):
+        """
+        Simpan hasil ke JSON Lines secara streaming (satu artikel per baris)
+        
+        Args:
+            data: List atau generator artikel (mis. iter_scrape_by_keyword)
+            filename: Nama file (.jsonl, .jsonl.gz, .jsonl.zst) atau stream biner
+            compression: None/'gzip'/'zstd' (default: dari ekstensi file)
+        """
+        count = exporters.save_to_jsonl(data, filename, compression)
+        print(f"Data disimpan ke JSONL: {exporters.target_name(filename)} ({count} artikel)")
+        return count
+    
+    def save_to_parquet(self, data, filename):
+        """
+        Simpan hasil ke Parquet (skema tetap, zstd, ditulis per row group)
         
-        with open(filename, 'w', encoding='utf-8') as f:
+        Args:
+            data: List atau generator artikel
+            filename: Nama file (.parquet) atau stream biner
+        """
+        count = exporters.save_to_parquet(data, filename, source='Kompas')
+        print(f"Data disimpan ke Parquet: {exporters.target_name(filename)} ({count} artikel)")
+        return count
+    
+    def save_to_store(self, data, store=None):
+        """
+        Simpan hasil ke arsip SQLite dengan indeks full-text (lihat article_store)
+        
+        Args:
+            data: List atau generator artikel
+            store: ArticleStore (default: arsip bersama di .cache/articles.sqlite)
+        """
+        store = store or get_default_store()
+        count = store.add_many((article for article in data if article.get('url')), source='Kompas')
+        print(f"Data disimpan ke arsip: {store.path} ({count} artikel)")
+        return count
+    
+    def save_to_txt(self, data, filename):
+        """Simpan hasil ke file teks (path atau stream biner)"""
+        # Direktori dibuat jika belum ada
+        with exporters.open_text(filename) as f:
             f.write(f"{'='*60}\n")
             f.write(f"LAPORAN SCRAPING KOMPAS\n")
             f.write(f"{'='*60}\n\n")
@@ -730,4 +1123,4 @@ class KompasScraper:
                 
                 f.write(f"\n{'-'*50}\n\n")
         
-        print(f"Data disimpan ke TXT: {filename}")
+        print(f"Data disimpan ke TXT: {exporters.target_name(filename)}")
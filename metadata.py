@@ -0,0 +1,208 @@
+"""
+Metadata Module
+Jalur cepat metadata artikel: baca hanya bagian <head> (JSON-LD dan meta tag
+og:/article:/name=...) tanpa membangun DOM body, untuk judul, penulis,
+tanggal terbit, keyword dan rubrik.
+"""
+
+import json
+import re
+from datetime import datetime
+
+from bs4 import SoupStrainer
+
+from html_parser import make_soup
+
+# Hanya elemen di <head> yang membawa metadata
+HEAD_STRAINER = SoupStrainer(['title', 'meta', 'script'])
+
+ARTICLE_TYPES = {'NewsArticle', 'Article', 'ReportageNewsArticle', 'AnalysisNewsArticle',
+                 'OpinionNewsArticle', 'BlogPosting'}
+
+# Urutan prioritas meta tag per field (nama/property, huruf kecil)
+META_FIELDS = {
+    'title': ['og:title', 'twitter:title', 'title'],
+    'author': ['author', 'article:author', 'dtk:author', 'content_author'],
+    'date_published': ['article:published_time', 'publishdate', 'dtk:publishdate',
+                       'content_publisheddate', 'date'],
+    'keywords': ['news_keywords', 'keywords', 'dtk:keywords', 'content_tag'],
+    'section': ['article:section', 'content_category', 'dtk:kanal'],
+    'description': ['og:description', 'description'],
+}
+
+# Bulan (3 huruf pertama, Indonesia/Inggris) pada tanggal tampilan halaman
+MONTHS = {'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'mei': 5, 'may': 5, 'jun': 6, 'jul': 7,
+          'agu': 8, 'aug': 8, 'sep': 9, 'okt': 10, 'oct': 10, 'nov': 11, 'des': 12, 'dec': 12}
+
+# 'DD-MM-YYYY', 'DD/MM/YYYY, HH:MM', 'Selasa, 02 Jan 2024 10:00 WIB'
+DISPLAY_DATE = re.compile(r'(\d{1,2})[ /-]([A-Za-z]+|\d{1,2})[ /-](\d{4})(?:[ ,]+(\d{1,2})[:.](\d{2}))?')
+
+
+def head_markup(markup):
+    """Potong markup (str/bytes) sampai </head>; seluruh markup jika tidak ditemukan"""
+    end_tag = b'</head>' if isinstance(markup, bytes) else '</head>'
+    match = re.search(re.escape(end_tag), markup, re.IGNORECASE)
+    return markup[:match.end()] if match else markup
+
+
+def meta_tags(soup):
+    """Dict nama/property meta (huruf kecil) -> content; kemunculan pertama menang"""
+    tags = {}
+    for meta in soup.find_all('meta'):
+        content = meta.get('content')
+        if not content:
+            continue
+        for attr in ('property', 'name', 'itemprop'):
+            key = meta.get(attr)
+            if key:
+                tags.setdefault(key.strip().lower(), content.strip())
+    return tags
+
+
+def iter_json_ld(soup):
+    """Yield semua objek JSON-LD (termasuk isi @graph dan list)"""
+    for script in soup.find_all('script', type='application/ld+json'):
+        text = script.string or script.get_text()
+        if not text or not text.strip():
+            continue
+        try:
+            data = json.loads(text, strict=False)
+        except ValueError:
+            continue
+
+        pending = [data]
+        while pending:
+            item = pending.pop(0)
+            if isinstance(item, list):
+                pending.extend(item)
+            elif isinstance(item, dict):
+                if isinstance(item.get('@graph'), list):
+                    pending.extend(item['@graph'])
+                yield item
+
+
+def json_ld_article(soup):
+    """Objek JSON-LD artikel pertama (NewsArticle/Article/...), atau dict kosong"""
+    fallback = {}
+    for item in iter_json_ld(soup):
+        types = item.get('@type')
+        types = {name for name in (types if isinstance(types, list) else [types]) if isinstance(name, str)}
+        if types & ARTICLE_TYPES:
+            return item
+        if not fallback and 'WebPage' in types and item.get('headline'):
+            fallback = item
+    return fallback
+
+
+def names(value):
+    """Nama dari field JSON-LD author/creator (str, dict, atau list)"""
+    if isinstance(value, str):
+        return [value.strip()] if value.strip() else []
+    if isinstance(value, dict):
+        return names(value.get('name'))
+    if isinstance(value, list):
+        return [name for item in value for name in names(item)]
+    return []
+
+
+def split_keywords(value):
+    """Keyword dari string dipisah koma atau list"""
+    if isinstance(value, list):
+        return [str(keyword).strip() for keyword in value if str(keyword).strip()]
+    if isinstance(value, str):
+        return [keyword.strip() for keyword in value.split(',') if keyword.strip()]
+    return []
+
+
+def parse_datetime(value):
+    """Parse tanggal ISO 8601 atau 'YYYY/MM/DD HH:MM:SS'; None jika gagal"""
+    if not value:
+        return None
+    value = value.strip().replace('/', '-')
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        match = re.match(r'\d{4}-\d{2}-\d{2}', value)
+        return datetime.fromisoformat(match.group(0)) if match else None
+
+
+def parse_article_date(value):
+    """
+    Parse tanggal artikel dalam format yang dihasilkan scraper: ISO 8601,
+    'DD-MM-YYYY' (Kompas) atau 'Selasa, 02 Jan 2024 10:00 WIB' (Detik)
+
+    Returns:
+        datetime (naif = WIB), atau None jika gagal
+    """
+    published = parse_datetime(value)
+    if published or not value:
+        return published
+    match = DISPLAY_DATE.search(value)
+    if not match:
+        return None
+    day, month, year, hour, minute = match.groups()
+    month = int(month) if month.isdigit() else MONTHS.get(month[:3].lower())
+    try:
+        return datetime(int(year), month, int(day), int(hour or 0), int(minute or 0))
+    except (TypeError, ValueError):
+        return None
+
+
+def extract_head_metadata(markup, backend=None, from_encoding=None):
+    """
+    Ekstrak metadata artikel dari <head> saja
+
+    Args:
+        markup: HTML halaman (str atau bytes)
+        backend: Backend parser HTML (lihat html_parser)
+        from_encoding: Encoding markup bytes jika sudah diketahui
+
+    Returns:
+        Dict berisi field yang ditemukan: title, author (list), date_published
+        (string asli), keywords (list), section, description
+    """
+    soup = make_soup(head_markup(markup), backend, parse_only=HEAD_STRAINER, from_encoding=from_encoding)
+    article = json_ld_article(soup)
+    meta = meta_tags(soup)
+
+    def first_meta(field):
+        for key in META_FIELDS[field]:
+            if meta.get(key):
+                return meta[key]
+        return None
+
+    metadata = {}
+
+    title = article.get('headline') or first_meta('title')
+    if not title and soup.title and soup.title.string:
+        title = soup.title.string
+    if isinstance(title, str) and title.strip():
+        metadata['title'] = title.strip()
+
+    authors = names(article.get('author')) or names(article.get('creator'))
+    if not authors and first_meta('author'):
+        authors = [first_meta('author')]
+    if authors:
+        metadata['author'] = authors
+
+    date_published = article.get('datePublished') or first_meta('date_published')
+    if isinstance(date_published, str) and date_published.strip():
+        metadata['date_published'] = date_published.strip()
+
+    keywords = split_keywords(article.get('keywords')) or split_keywords(first_meta('keywords'))
+    if keywords:
+        metadata['keywords'] = keywords
+
+    section = article.get('articleSection') or first_meta('section')
+    if isinstance(section, list):
+        section = ', '.join(str(item) for item in section if item)
+    if isinstance(section, str) and section.strip():
+        metadata['section'] = section.strip()
+
+    description = article.get('description') or first_meta('description')
+    if isinstance(description, str) and description.strip():
+        metadata['description'] = description.strip()
+
+    return metadata
@@ -0,0 +1,155 @@
+"""
+Parse Pool Module
+Pipeline dua tahap untuk detail artikel: thread I/O mengunduh halaman,
+lalu ProcessPoolExecutor mem-parse byte HTML menjadi record artikel, sehingga
+parsing (CPU-bound) tidak lagi antre di GIL bersama thread fetch.
+"""
+
+import multiprocessing
+import os
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+
+import requests
+
+# Scraper per proses worker, dibuat sekali per (kelas, backend)
+_worker_scrapers = {}
+
+_DONE = object()
+
+
+def default_parse_workers():
+    """Jumlah proses parsing default: semua core"""
+    return os.cpu_count() or 1
+
+
+def _mp_context():
+    """
+    Start method proses worker: forkserver (spawn jika tidak tersedia). Tidak
+    memakai fork karena worker dibuat saat thread I/O sedang memegang lock
+    (koneksi requests, cache, logging) yang akan ikut tersalin terkunci.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context('spawn')
+
+
+def _completed(value):
+    """Future yang sudah selesai (untuk URL yang gagal diunduh)"""
+    future = Future()
+    future.set_result(value)
+    return future
+
+
+def _worker_scraper(scraper_class, parser_backend):
+    key = (scraper_class, parser_backend)
+    if key not in _worker_scrapers:
+        # Worker hanya mem-parse: tanpa cache dan tanpa request
+        _worker_scrapers[key] = scraper_class(cache=None, parser_backend=parser_backend)
+    return _worker_scrapers[key]
+
+
+def build_response(url, body, encoding=None):
+    """requests.Response dari byte HTML yang sudah diunduh/tersimpan (encoding dideklarasikan di header)"""
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response._content = body
+    response.encoding = encoding
+    if encoding:
+        response.headers['Content-Type'] = f'text/html; charset={encoding}'
+    return response
+
+
+def parse_page(scraper_class, parser_backend, url, body, encoding, metadata_only=False):
+    """Jalan di proses worker: byte HTML -> record artikel (sama dengan parse_response)"""
+    response = build_response(url, body, encoding)
+    return _worker_scraper(scraper_class, parser_backend).parse_response(response, url, metadata_only)
+
+
+class ParsePipeline:
+    def __init__(self, scraper, io_workers=None, parse_workers=None, queue_size=None):
+        """
+        Args:
+            scraper: KompasScraper/DetikScraper (dipakai untuk download_article)
+            io_workers: Thread pengunduh (default: scraper.max_workers)
+            parse_workers: Proses parsing (default: jumlah core)
+            queue_size: Maksimal halaman terunduh yang menunggu/sedang di-parse
+                        (default: 2x parse_workers); pengunduh berhenti jika penuh
+        """
+        self.scraper = scraper
+        self.io_workers = max(1, io_workers or scraper.max_workers)
+        self.parse_workers = max(1, parse_workers or default_parse_workers())
+        self.queue_size = max(1, queue_size or self.parse_workers * 2)
+
+    def iter_article_details(self, urls, metadata_only=False):
+        """Yield detail artikel sesuai urutan urls (None untuk yang gagal)"""
+        if not urls:
+            return
+
+        parsed = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        scraper_class = type(self.scraper)
+        backend = self.scraper.parser_backend
+
+        def put(item):
+            # Tunggu slot antrian, tapi berhenti jika konsumen sudah selesai
+            while not stop.is_set():
+                try:
+                    parsed.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def hand_off(pool, url, download):
+            try:
+                response = download.result()
+                if response is not None:
+                    return put(pool.submit(parse_page, scraper_class, backend, url,
+                                           response.content, self.scraper.encodings.encoding_for(response),
+                                           metadata_only))
+            except Exception as e:
+                print(f"   Error tahap unduh: {e}")
+            return put(_completed(None))
+
+        def produce(pool):
+            try:
+                with ThreadPoolExecutor(max_workers=min(self.io_workers, len(urls))) as io:
+                    downloads = deque()
+                    for url in urls:
+                        if stop.is_set():
+                            break
+                        downloads.append((url, io.submit(self.scraper.download_article, url)))
+                        if len(downloads) >= self.io_workers * 2:
+                            if not hand_off(pool, *downloads.popleft()):
+                                break
+                    while downloads and not stop.is_set():
+                        if not hand_off(pool, *downloads.popleft()):
+                            break
+            except Exception as e:
+                print(f"   Error tahap unduh: {e}")
+            finally:
+                put(_DONE)
+
+        with ProcessPoolExecutor(max_workers=min(self.parse_workers, len(urls)),
+                                 mp_context=_mp_context()) as pool:
+            producer = threading.Thread(target=produce, args=(pool,), daemon=True)
+            producer.start()
+            try:
+                while True:
+                    future = parsed.get()
+                    if future is _DONE:
+                        break
+                    try:
+                        article = future.result()
+                    except Exception as e:
+                        print(f"   Error parsing artikel: {e}")
+                        article = None
+                    # Halaman lanjutan artikel multi-halaman (jika ada) diambil di sini
+                    yield self.scraper.complete_article(article) if article else article
+            finally:
+                stop.set()
+                producer.join()
@@ -0,0 +1,251 @@
+"""
+Rate Limiter Module
+Pembatas laju request per host (token bucket) dengan konkurensi adaptif.
+Semua scraper memakai satu registry bersama sehingga batas laju berlaku
+per website, bukan per objek scraper.
+"""
+
+import asyncio
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+
+class HostLimiter:
+    """Token bucket + batas konkurensi untuk satu host"""
+
+    def __init__(self, rate=2.0, burst=4, min_rate=0.2, max_rate=20.0,
+                 concurrency=2, max_concurrency=16, slow_threshold=5.0,
+                 increase_after=5):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.concurrency = concurrency
+        self.max_concurrency = max_concurrency
+        self.slow_threshold = slow_threshold
+        self.increase_after = increase_after
+
+        self.cond = threading.Condition()
+        self.tokens = float(burst)
+        self.last_refill = time.monotonic()
+        self.paused_until = 0.0
+        self.active = 0
+        self.fast_streak = 0
+        # Coroutine yang menunggu slot konkurensi: (event loop, future)
+        self.async_waiters = []
+
+        # Statistik
+        self.total_requests = 0
+        self.throttled = 0
+        self.slow = 0
+
+    def try_acquire(self):
+        """
+        Coba ambil slot konkurensi dan token tanpa blocking
+
+        Returns:
+            0 jika berhasil, detik yang perlu ditunggu, atau None jika
+            harus menunggu slot konkurensi dilepas
+        """
+        with self.cond:
+            if self.active >= self.concurrency:
+                return None
+
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+
+            if now < self.paused_until:
+                return self.paused_until - now
+            if self.tokens < 1:
+                return (1 - self.tokens) / self.rate
+
+            self.tokens -= 1
+            self.active += 1
+            self.total_requests += 1
+            return 0
+
+    def acquire(self):
+        """Tunggu slot konkurensi dan token sebelum mengirim request"""
+        while True:
+            with self.cond:
+                wait_time = self.try_acquire()
+                if wait_time == 0:
+                    return
+                if wait_time is None:
+                    self.cond.wait()
+                    continue
+            time.sleep(wait_time)
+
+    async def acquire_async(self):
+        """
+        Versi asyncio dari acquire(), tidak memblokir event loop
+
+        Jika slot konkurensi penuh, coroutine tidur di sebuah future yang
+        dibangunkan oleh release(), bukan polling.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            waiter = None
+            with self.cond:
+                wait_time = self.try_acquire()
+                if wait_time == 0:
+                    return
+                if wait_time is None:
+                    waiter = loop.create_future()
+                    self.async_waiters.append((loop, waiter))
+
+            if waiter is None:
+                await asyncio.sleep(wait_time)
+                continue
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self.cond:
+                    if (loop, waiter) in self.async_waiters:
+                        self.async_waiters.remove((loop, waiter))
+                    else:
+                        # Sudah dibangunkan: teruskan ke penunggu berikutnya
+                        self.wake_async(1)
+                raise
+
+    def wake_async(self, count):
+        """Bangunkan sampai `count` coroutine penunggu (dipanggil dengan lock dipegang)"""
+        while count > 0 and self.async_waiters:
+            loop, waiter = self.async_waiters.pop(0)
+            try:
+                loop.call_soon_threadsafe(_wake, waiter)
+            except RuntimeError:
+                # Event loop penunggu sudah ditutup
+                continue
+            count -= 1
+
+    def release(self, status_code=None, elapsed=None, retry_after=None):
+        """Lepas slot dan sesuaikan laju berdasarkan respons server"""
+        with self.cond:
+            self.active -= 1
+
+            if status_code in (429, 503) or retry_after:
+                # Server minta pelan: turunkan laju & konkurensi setengahnya
+                self.throttled += 1
+                self.backoff(0.5)
+                if retry_after:
+                    self.paused_until = max(self.paused_until, time.monotonic() + retry_after)
+            elif status_code is None or (elapsed is not None and elapsed > self.slow_threshold):
+                # Error koneksi/timeout atau respons lambat
+                self.slow += 1
+                self.backoff(0.8)
+            elif status_code < 400:
+                self.fast_streak += 1
+                if self.fast_streak >= self.increase_after:
+                    self.fast_streak = 0
+                    self.concurrency = min(self.max_concurrency, self.concurrency + 1)
+                    self.rate = min(self.max_rate, self.rate * 1.25)
+
+            self.cond.notify_all()
+            self.wake_async(max(1, self.concurrency - self.active))
+
+    def backoff(self, factor):
+        """Kurangi laju dan konkurensi (dipanggil dengan lock dipegang)"""
+        self.fast_streak = 0
+        self.rate = max(self.min_rate, self.rate * factor)
+        self.concurrency = max(1, int(self.concurrency * factor))
+
+    def stats(self):
+        """Statistik limiter untuk host ini"""
+        with self.cond:
+            return {
+                'rate': round(self.rate, 2),
+                'concurrency': self.concurrency,
+                'active': self.active,
+                'total_requests': self.total_requests,
+                'throttled': self.throttled,
+                'slow': self.slow,
+            }
+
+
+class RateLimiter:
+    """Registry HostLimiter, satu limiter untuk setiap host"""
+
+    def __init__(self, **host_options):
+        self.host_options = host_options
+        self.hosts = {}
+        self.lock = threading.Lock()
+
+    def for_host(self, url):
+        """Ambil (atau buat) limiter untuk host dari URL"""
+        host = urlparse(url).netloc.lower()
+        with self.lock:
+            limiter = self.hosts.get(host)
+            if limiter is None:
+                limiter = HostLimiter(**self.host_options)
+                self.hosts[host] = limiter
+            return limiter
+
+    def request(self, send, url, **kwargs):
+        """Kirim request lewat limiter host, mis. request(session.get, url)"""
+        limiter = self.for_host(url)
+        limiter.acquire()
+        start = time.monotonic()
+        try:
+            response = send(url, **kwargs)
+        except Exception:
+            limiter.release(elapsed=time.monotonic() - start)
+            raise
+
+        self.release_response(limiter, response, time.monotonic() - start)
+        return response
+
+    async def request_async(self, send, url, **kwargs):
+        """Versi asyncio dari request(), mis. await request_async(client.get, url)"""
+        limiter = self.for_host(url)
+        await limiter.acquire_async()
+        start = time.monotonic()
+        try:
+            response = await send(url, **kwargs)
+        except Exception:
+            limiter.release(elapsed=time.monotonic() - start)
+            raise
+
+        self.release_response(limiter, response, time.monotonic() - start)
+        return response
+
+    def release_response(self, limiter, response, elapsed):
+        """Lepas slot limiter berdasarkan respons yang diterima"""
+        limiter.release(
+            status_code=response.status_code,
+            elapsed=elapsed,
+            retry_after=parse_retry_after(response.headers.get('Retry-After'))
+        )
+
+    def stats(self):
+        """Statistik semua host"""
+        with self.lock:
+            hosts = dict(self.hosts)
+        return {host: limiter.stats() for host, limiter in hosts.items()}
+
+
+def _wake(waiter):
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+def parse_retry_after(value):
+    """Ubah header Retry-After (detik atau HTTP-date) menjadi detik"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+# Limiter bersama untuk semua scraper dalam satu proses
+shared_limiter = RateLimiter()
@@ -0,0 +1,41 @@
+"""
+Scraper Factory
+Pilih sumber berita dan engine (sync/async) dengan satu opsi
+"""
+
+from kompas import KompasScraper
+from detik import DetikScraper
+from async_scraper import AsyncKompasScraper, AsyncDetikScraper, SyncBridge
+
+SCRAPERS = {
+    'Kompas': {'sync': KompasScraper, 'async': AsyncKompasScraper},
+    'Detik': {'sync': DetikScraper, 'async': AsyncDetikScraper},
+}
+
+ENGINES = ('sync', 'async')
+
+
+def create_scraper(source, engine='sync', **kwargs):
+    """
+    Buat scraper untuk sumber berita tertentu
+
+    Args:
+        source: Nama sumber berita ('Kompas' atau 'Detik')
+        engine: 'sync' (threads + requests) atau 'async' (asyncio + httpx)
+        **kwargs: Opsi scraper, sama untuk kedua engine (max_workers, rate_limiter,
+                  cache, parser_backend, pool_size, parse_workers); engine async
+                  memakai max_workers sebagai batas konkurensi
+
+    Returns:
+        Objek dengan method yang sama untuk kedua engine
+        (get_total_search_pages, search_articles, get_article_detail, ...)
+    """
+    if source not in SCRAPERS:
+        raise ValueError(f"Sumber berita tidak didukung: {source}")
+    if engine not in ENGINES:
+        raise ValueError(f"Engine tidak dikenal: {engine}")
+
+    scraper = SCRAPERS[source][engine](**kwargs)
+    if engine == 'async':
+        return SyncBridge(scraper)
+    return scraper
@@ -0,0 +1,68 @@
+"""
+Search Session Module
+Satu alur pencarian (sumber + keyword) yang menyimpan halaman 1 yang sudah
+diambil, total halaman, dan hasil setiap halaman pencarian, sehingga tidak ada
+halaman pencarian yang diunduh dua kali dalam satu workflow.
+"""
+
+
+class SearchSession:
+    def __init__(self, scraper, keyword):
+        """
+        Args:
+            scraper: Scraper dari create_scraper (engine sync atau async)
+            keyword: Kata kunci pencarian
+        """
+        self.scraper = scraper
+        self.keyword = keyword
+        # Dokumen halaman 1 (hasil parse parsial) dan total halaman dari pagination-nya
+        self.first_soup = None
+        self.total_pages = None
+        # Nomor halaman -> hasil parse_search_page
+        self.pages = {}
+
+    def load_first_page(self):
+        """Ambil halaman 1 sekali saja; total halaman dan daftar artikelnya disimpan"""
+        if self.first_soup is None:
+            print("Mengambil halaman 1...")
+            soup = self.scraper.fetch_search_page(self.keyword, 1)
+            self.total_pages = self.scraper.get_total_pages(soup) or 1
+            self.pages[1] = self.scraper.parse_search_page(soup)
+            self.first_soup = soup
+        return self.first_soup
+
+    def get_total_search_pages(self):
+        """Total halaman pencarian (halaman 1 diambil jika belum)"""
+        try:
+            self.load_first_page()
+        except Exception as e:
+            print(f"Error mendapatkan total halaman: {e}")
+            return 1
+        return self.total_pages
+
+    def search_articles(self, max_pages=None):
+        """
+        Kumpulkan artikel dari halaman 1..max_pages; hanya halaman yang belum
+        pernah diambil yang diunduh (paralel)
+
+        Returns:
+            (list artikel, jumlah halaman yang dipakai)
+        """
+        print(f"[SEARCHING] Memulai pencarian untuk keyword: {self.keyword}")
+        try:
+            self.load_first_page()
+        except Exception as e:
+            print(f"Error saat mengambil halaman 1: {e}")
+            return [], None
+
+        last_page = min(self.total_pages, max_pages) if max_pages else self.total_pages
+        missing = [page for page in range(2, last_page + 1) if page not in self.pages]
+        if missing:
+            results = self.scraper.fetch_search_pages(self.keyword, missing)
+            for page, result in zip(missing, results):
+                # Halaman gagal (None) tidak disimpan agar bisa dicoba lagi
+                if result is not None:
+                    self.pages[page] = result
+
+        pages = [self.pages.get(page) for page in range(1, last_page + 1)]
+        return self.scraper.merge_search_pages(pages), last_page
@@ -0,0 +1,94 @@
+"""
+Seen URL Index Module
+Indeks persisten (SQLite) berisi URL artikel yang sudah pernah di-scrape
+beserta record-nya, agar run berikutnya hanya mengambil artikel baru.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from article import Article, json_default
+from http_cache import normalize_url
+
+DEFAULT_INDEX_PATH = os.path.join('.cache', 'seen_urls.sqlite')
+
+
+class SeenUrlIndex:
+    def __init__(self, path=DEFAULT_INDEX_PATH):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS seen (
+                key TEXT PRIMARY KEY,
+                url TEXT,
+                source TEXT,
+                record TEXT,
+                scraped_at REAL
+            )
+        """)
+        self.conn.commit()
+
+    def get_many(self, urls):
+        """
+        Cari URL yang sudah pernah di-scrape
+
+        Returns:
+            Dict url -> record artikel tersimpan (hanya untuk URL yang ditemukan)
+        """
+        keys = {normalize_url(url): url for url in urls}
+        found = {}
+        key_list = list(keys)
+        with self.lock:
+            # Batas jumlah parameter SQLite: query per potongan
+            for start in range(0, len(key_list), 500):
+                chunk = key_list[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self.conn.execute(
+                    f"SELECT key, record FROM seen WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+                for key, record in rows:
+                    found[keys[key]] = Article(json.loads(record))
+        return found
+
+    def __contains__(self, url):
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT 1 FROM seen WHERE key = ?", (normalize_url(url),)
+            ).fetchone()
+        return row is not None
+
+    def add(self, article, source=''):
+        """Catat artikel yang berhasil di-scrape"""
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO seen VALUES (?, ?, ?, ?, ?)",
+                (normalize_url(article['url']), article['url'], source,
+                 json.dumps(article, ensure_ascii=False, default=json_default), time.time())
+            )
+            self.conn.commit()
+
+    def count(self):
+        """Jumlah URL di indeks"""
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+
+
+_default_index = None
+_default_index_lock = threading.Lock()
+
+
+def get_default_index():
+    """Indeks bersama untuk semua scraper dalam satu proses"""
+    global _default_index
+    with _default_index_lock:
+        if _default_index is None:
+            _default_index = SeenUrlIndex()
+        return _default_index
@@ -0,0 +1,103 @@
+"""
+Selector Cache Module
+Mengingat selector CSS mana yang berhasil untuk setiap extractor per situs
+(subdomain/rubrik). Di halaman berikutnya selector di atas pemenang dicek
+sekaligus dalam satu scan, bukan satu scan gagal per selector; urutan
+prioritas (dan hasilnya) tetap sama dengan tanpa cache.
+"""
+
+import threading
+from urllib.parse import urlsplit
+
+
+def site_key(url):
+    """Kunci situs dari URL: hostname (subdomain = rubrik, mis. nasional.kompas.com)"""
+    return (urlsplit(url).hostname or '').lower() if url else ''
+
+
+class SelectorCache:
+    def __init__(self):
+        self.lock = threading.Lock()
+        # (extractor, situs) -> selector yang terakhir berhasil
+        self.winners = {}
+        # extractor -> {'hits': ..., 'misses': ..., 'lookups': ...}
+        self.counters = {}
+
+    def candidates(self, soup, group, site, selectors):
+        """
+        Selector yang perlu dicoba, sesuai urutan prioritas asli
+
+        Jika pemenang sebelumnya ada di posisi ke-i, selector di atasnya dicek
+        sekaligus dengan satu selector list (satu kali scan DOM). Hanya jika
+        tidak ada yang cocok pencarian langsung mulai dari pemenang; hasilnya
+        selalu sama dengan mencoba semua selector berurutan.
+
+        Returns:
+            (daftar selector, jumlah lookup untuk pengecekan)
+        """
+        winner = self.winners.get((group, site))
+        if winner not in selectors:
+            return selectors, 0
+        index = selectors.index(winner)
+        if index == 0:
+            return selectors, 0
+        if soup.select_one(', '.join(selectors[:index])) is None:
+            return selectors[index:], 1
+        return selectors, 1
+
+    def first_match(self, soup, group, selectors, site='', extract=None):
+        """
+        Coba selector sesuai urutan prioritas, selector di atas pemenang untuk
+        situs ini dilewati jika tidak ada yang cocok (lihat candidates)
+
+        Args:
+            soup: BeautifulSoup / Tag tempat mencari
+            group: Nama extractor (mis. 'title')
+            selectors: Daftar selector CSS dengan urutan prioritas asli
+            site: Kunci situs (lihat site_key)
+            extract: Fungsi (selector, element) -> nilai; nilai kosong berarti
+                     lanjut ke selector berikutnya (default: element itu sendiri)
+
+        Returns:
+            Nilai dari selector pertama yang berhasil, atau None
+        """
+        winner = self.winners.get((group, site))
+        candidates, lookups = self.candidates(soup, group, site, selectors)
+        value = None
+        matched = None
+
+        for selector in candidates:
+            lookups += 1
+            element = soup.select_one(selector)
+            if element is None:
+                continue
+            value = extract(selector, element) if extract else element
+            if value:
+                matched = selector
+                break
+            value = None
+
+        with self.lock:
+            counter = self.counters.setdefault(group, {'hits': 0, 'misses': 0, 'lookups': 0})
+            counter['lookups'] += lookups
+            if matched is not None and matched == winner:
+                counter['hits'] += 1
+            else:
+                counter['misses'] += 1
+            if matched is not None and matched != winner:
+                self.winners[(group, site)] = matched
+        return value
+
+    def stats(self):
+        """Hit/miss per extractor dan selector pemenang per situs"""
+        with self.lock:
+            stats = {}
+            for group, counter in self.counters.items():
+                calls = counter['hits'] + counter['misses']
+                stats[group] = dict(
+                    counter,
+                    hit_rate=counter['hits'] / calls if calls else 0.0,
+                    lookups_per_call=counter['lookups'] / calls if calls else 0.0,
+                    winners={site: selector for (name, site), selector in self.winners.items() if name == group},
+                )
+            return stats